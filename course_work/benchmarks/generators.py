@@ -0,0 +1,24 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+# Синтетические задачи для замеров: равномерные и кластерные точки.
+# Генераторы детерминированы при одинаковом зерне
+
+
+# Точки, равномерно распределенные в квадрате [0, size] x [0, size]
+def uniform_points(n: int, seed: int = 0, size: float = 1000.0) -> List[Tuple[float, float]]:
+    rng = np.random.default_rng(seed)
+    return [tuple(point) for point in (rng.random((n, 2)) * size).tolist()]
+
+
+# Точки, сгруппированные вокруг случайных центров (нормальное распределение
+# с разбросом spread от стороны квадрата), обрезанные по границам квадрата
+def clustered_points(n: int, clusters: int = 5, seed: int = 0, size: float = 1000.0,
+                     spread: float = 0.05) -> List[Tuple[float, float]]:
+    rng = np.random.default_rng(seed)
+    centers = rng.random((clusters, 2)) * size
+    labels = rng.integers(clusters, size=n)
+    points = centers[labels] + rng.normal(scale=spread * size, size=(n, 2))
+    return [tuple(point) for point in np.clip(points, 0.0, size).tolist()]
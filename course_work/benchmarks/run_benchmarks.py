@@ -0,0 +1,136 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from random import seed
+from statistics import mean
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Корневая папка проекта нужна для импорта models при запуске скрипта напрямую
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generators import clustered_points, uniform_points
+from benchmarks.tsplib import bundled_instances
+from models.aco_algorithm import ACOAlgorithm
+
+# Замеры качества и скорости муравьиного алгоритма.
+# Для каждой задачи и каждого ограничения времени решение запускается несколько
+# раз с разными зернами; в отчет попадают время работы, число построенных путей
+# в секунду и отклонение от известного оптимума. Отчет сохраняется в JSON,
+# чтобы результаты разных версий можно было сравнивать.
+#
+# Запуск из папки course_work:
+#     python -m benchmarks.run_benchmarks --budgets 0.5 1 2 --output report.json
+
+# Верхняя граница числа итераций: остановку задает ограничение времени
+MAX_ITERATIONS = 10 ** 6
+
+
+# Один запуск с ограничением времени: длина пути, время и число построенных путей
+def run_once(points: List[Tuple[float, float]], distance_matrix, budget: float,
+             params: Dict[str, Any]) -> Tuple[float, float, int]:
+    algorithm = ACOAlgorithm(iterations=MAX_ITERATIONS, time_budget_s=budget, **params)
+    start = perf_counter()
+    snapshot = None
+    for snapshot in algorithm.solve_tsp_iter(points, distance_matrix):
+        pass
+    wall_time = perf_counter() - start
+    return snapshot.best_length, wall_time, snapshot.iteration * algorithm.ants
+
+
+# Замеры одной задачи при нескольких ограничениях времени
+def benchmark_instance(name: str, points: List[Tuple[float, float]], distance_matrix,
+                       optimum: Optional[float], budgets: Sequence[float],
+                       params: Dict[str, Any], repeats: int = 3,
+                       base_seed: int = 0) -> Dict[str, Any]:
+    results = []
+    for budget in budgets:
+        lengths, wall_times, constructions = [], [], []
+        for repeat in range(repeats):
+            seed(base_seed + repeat)
+            length, wall_time, count = run_once(points, distance_matrix, budget, params)
+            lengths.append(length)
+            wall_times.append(wall_time)
+            constructions.append(count)
+        best_length = min(lengths)
+        results.append({
+            "budget_s": budget,
+            "wall_time_s": mean(wall_times),
+            "constructions_per_s": sum(constructions) / sum(wall_times),
+            "best_length": best_length,
+            "mean_length": mean(lengths),
+            "gap_percent": _gap(best_length, optimum),
+            "mean_gap_percent": _gap(mean(lengths), optimum),
+        })
+    return {"name": name, "size": len(points), "optimum": optimum, "results": results}
+
+
+# Отклонение от оптимума в процентах (None, если оптимум неизвестен)
+def _gap(length: float, optimum: Optional[float]) -> Optional[float]:
+    if optimum is None:
+        return None
+    return 100.0 * (length - optimum) / optimum
+
+
+# Набор задач: поставляемые задачи TSPLIB и синтетические задачи заданных размеров.
+# Элемент набора - (имя, точки, матрица расстояний или None, оптимум или None)
+def default_suite(sizes: Sequence[int] = (100,), suite_seed: int = 0) -> List[tuple]:
+    suite = [(instance.name, instance.points, instance.distance_matrix(),
+              instance.optimal_length())
+             for instance in bundled_instances()]
+    for n in sizes:
+        suite.append((f"uniform{n}", uniform_points(n, suite_seed), None, None))
+        suite.append((f"clustered{n}", clustered_points(n, seed=suite_seed), None, None))
+    return suite
+
+
+# Замеры всего набора задач; возвращает отчет в виде словаря
+def run_benchmarks(suite: List[tuple], budgets: Sequence[float], params: Dict[str, Any],
+                   repeats: int = 3, base_seed: int = 0) -> Dict[str, Any]:
+    return {
+        "created": datetime.now().isoformat(),
+        "params": params,
+        "budgets_s": list(budgets),
+        "repeats": repeats,
+        "instances": [benchmark_instance(name, points, distance_matrix, optimum, budgets,
+                                         params, repeats, base_seed)
+                      for name, points, distance_matrix, optimum in suite],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="ACO benchmark on TSPLIB and synthetic instances")
+    parser.add_argument("--budgets", type=float, nargs="+", default=[0.5, 1.0, 2.0],
+                        help="time budgets in seconds")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100],
+                        help="sizes of synthetic instances")
+    parser.add_argument("--ants", type=int, default=20)
+    parser.add_argument("--strategy", default="as")
+    parser.add_argument("--candidates", type=int, default=None)
+    parser.add_argument("--local-search", default=None)
+    parser.add_argument("--output", default="benchmark_report.json")
+    args = parser.parse_args(argv)
+
+    params = {"ants": args.ants, "strategy": args.strategy,
+              "candidates": args.candidates, "local_search": args.local_search}
+    report = run_benchmarks(default_suite(args.sizes, args.seed), args.budgets, params,
+                            args.repeats, args.seed)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    for instance in report["instances"]:
+        for result in instance["results"]:
+            gap = result["gap_percent"]
+            gap_text = f"{gap:.2f}%" if gap is not None else "-"
+            print(f"{instance['name']:>14} {result['budget_s']:>6.2f} s "
+                  f"{result['best_length']:>12.1f} gap {gap_text:>8} "
+                  f"{result['constructions_per_s']:>10.0f} tours/s")
+    print(f"Report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
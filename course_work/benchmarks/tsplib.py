@@ -0,0 +1,169 @@
+import os
+from math import acos, cos, sqrt
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+# Чтение задач в формате TSPLIB (.tsp) и известных оптимальных путей (.opt.tour).
+# Поддерживаются координатные задачи с типами расстояний EUC_2D, ATT и GEO;
+# расстояния вычисляются по правилам TSPLIB с округлением до целых
+
+# Папка с поставляемыми классическими задачами
+INSTANCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instances")
+
+# Константы из описания формата TSPLIB для типа GEO
+GEO_PI = 3.141592
+EARTH_RADIUS = 6378.388
+
+
+# Задача TSPLIB: координаты точек, тип расстояний и (если известен) оптимальный путь
+class TSPLIBInstance:
+    def __init__(self, name: str, points: List[Tuple[float, float]], edge_weight_type: str,
+                 comment: str = "", optimal_tour: Optional[List[int]] = None):
+        # Имя задачи
+        self.name = name
+        # Координаты точек (для GEO - широта и долгота в формате DDD.MM)
+        self.points = points
+        # Тип расстояний: "EUC_2D", "ATT" или "GEO"
+        self.edge_weight_type = edge_weight_type
+        # Комментарий из файла
+        self.comment = comment
+        # Оптимальный замкнутый путь (индексы с нуля) или None
+        self.optimal_tour = optimal_tour
+
+    # Матрица расстояний по правилам TSPLIB
+    def distance_matrix(self) -> np.ndarray:
+        return distance_matrix(self.points, self.edge_weight_type)
+
+    # Длина оптимального пути или None, если путь неизвестен
+    def optimal_length(self) -> Optional[float]:
+        if self.optimal_tour is None:
+            return None
+        matrix = self.distance_matrix()
+        tour = np.asarray(self.optimal_tour, dtype=np.intp)
+        return float(matrix[tour[:-1], tour[1:]].sum())
+
+
+# Разбор заголовка "KEY: VALUE" (двоеточие может быть окружено пробелами)
+def _parse_header(lines: List[str]) -> Tuple[Dict[str, str], int]:
+    header = {}
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        if ":" not in line:
+            # Начало секции данных
+            return header, index
+        key, value = line.split(":", 1)
+        header[key.strip().upper()] = value.strip()
+    return header, len(lines)
+
+
+# Разбор текста файла .tsp
+def parse_tsp(text: str) -> TSPLIBInstance:
+    lines = text.splitlines()
+    header, index = _parse_header(lines)
+    edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "")
+    if edge_weight_type not in DISTANCE_FUNCTIONS:
+        raise ValueError(f"Unsupported edge weight type: {edge_weight_type}")
+    if index >= len(lines) or lines[index].strip() != "NODE_COORD_SECTION":
+        raise ValueError("Missing NODE_COORD_SECTION")
+    dimension = int(header["DIMENSION"])
+    points = []
+    for line in lines[index + 1:index + 1 + dimension]:
+        _, x, y = line.split()[:3]
+        points.append((float(x), float(y)))
+    if len(points) != dimension:
+        raise ValueError("Number of coordinates does not match DIMENSION")
+    return TSPLIBInstance(header.get("NAME", ""), points, edge_weight_type,
+                          header.get("COMMENT", ""))
+
+
+# Разбор текста файла .opt.tour; возвращает замкнутый путь с индексами от нуля
+def parse_tour(text: str) -> List[int]:
+    lines = text.splitlines()
+    _, index = _parse_header(lines)
+    if index >= len(lines) or lines[index].strip() != "TOUR_SECTION":
+        raise ValueError("Missing TOUR_SECTION")
+    tour = []
+    for line in lines[index + 1:]:
+        for value in line.split():
+            node = int(value)
+            if node == -1:
+                return tour + tour[:1]
+            tour.append(node - 1)
+    return tour + tour[:1]
+
+
+# Чтение задачи из файла; оптимальный путь берется из соседнего файла .opt.tour
+def read_tsp(path: str) -> TSPLIBInstance:
+    with open(path, encoding="utf-8") as file:
+        instance = parse_tsp(file.read())
+    if not instance.name:
+        instance.name = os.path.basename(path).split(".")[0]
+    tour_path = os.path.splitext(path)[0] + ".opt.tour"
+    if os.path.exists(tour_path):
+        instance.optimal_tour = read_tour(tour_path)
+    return instance
+
+
+# Чтение оптимального пути из файла .opt.tour
+def read_tour(path: str) -> List[int]:
+    with open(path, encoding="utf-8") as file:
+        return parse_tour(file.read())
+
+
+# Поставляемые задачи, упорядоченные по размеру
+def bundled_instances() -> List[TSPLIBInstance]:
+    instances = [read_tsp(os.path.join(INSTANCES_DIR, name))
+                 for name in os.listdir(INSTANCES_DIR) if name.endswith(".tsp")]
+    return sorted(instances, key=lambda instance: len(instance.points))
+
+
+# Евклидово расстояние, округленное до ближайшего целого
+def euc_2d(a: Tuple[float, float], b: Tuple[float, float]) -> int:
+    return int(sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) + 0.5)
+
+
+# Псевдоевклидово расстояние (задачи att48, att532)
+def att(a: Tuple[float, float], b: Tuple[float, float]) -> int:
+    r = sqrt(((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) / 10.0)
+    t = int(r + 0.5)
+    return t + 1 if t < r else t
+
+
+# Перевод координаты DDD.MM (градусы и минуты) в радианы
+def _geo_radians(value: float) -> float:
+    degrees = int(value)
+    minutes = value - degrees
+    return GEO_PI * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+
+# Географическое расстояние в километрах по формуле TSPLIB
+def geo(a: Tuple[float, float], b: Tuple[float, float]) -> int:
+    latitude_a, longitude_a = _geo_radians(a[0]), _geo_radians(a[1])
+    latitude_b, longitude_b = _geo_radians(b[0]), _geo_radians(b[1])
+    q1 = cos(longitude_a - longitude_b)
+    q2 = cos(latitude_a - latitude_b)
+    q3 = cos(latitude_a + latitude_b)
+    return int(EARTH_RADIUS * acos(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)) + 1.0)
+
+
+# Функции расстояния по типу EDGE_WEIGHT_TYPE
+DISTANCE_FUNCTIONS = {
+    "EUC_2D": euc_2d,
+    "ATT": att,
+    "GEO": geo,
+}
+
+
+# Матрица расстояний заданного типа (диагональ нулевая)
+def distance_matrix(points: List[Tuple[float, float]], edge_weight_type: str) -> np.ndarray:
+    function = DISTANCE_FUNCTIONS[edge_weight_type]
+    n = len(points)
+    matrix = np.zeros((n, n), dtype=np.float64)
+    for i in range(n):
+        for j in range(i + 1, n):
+            matrix[i, j] = matrix[j, i] = function(points[i], points[j])
+    return matrix
@@ -1,7 +1,7 @@
 import time
 from models.graph_model import GraphModel
 from models.aco_algorithm import ACOAlgorithm
-from models.database import DatabaseManager
+from models.database import DatabaseManager, hash_points
 from views.main_window import MainWindow
 from utils.path import Path
 from PySide6.QtWidgets import QInputDialog
@@ -160,9 +160,13 @@ class MainController:
                 rho=params['rho'],
                 q=params['q']
             )
-            # Получение точек и решение задачи
+            # Получение точек и решение задачи по матрице модели с учетом весов ребер
             points = self.model.get_points()
-            solution = algorithm.solve_tsp(points)
+            # Теплый старт от лучших сохраненных путей для того же набора точек
+            points_hash = hash_points(points)
+            warm_start = [indices for indices, _ in self.database.get_best_tours(points_hash)]
+            solution = algorithm.solve_tsp(points, distance_matrix=self.model.distance_matrix,
+                                           warm_start=warm_start or None)
 
             computation_time = time.time() - start_time
             # Сохранение результата в базу данных
@@ -171,7 +175,8 @@ class MainController:
                 algorithm_params=params,
                 path_length=solution.length,
                 path_indices=solution.indices,
-                computation_time=computation_time
+                computation_time=computation_time,
+                points_hash=points_hash
             )
             # Обновление графического представления с решением
             self.view.draw_solution(solution.indices)
@@ -1,14 +1,53 @@
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import accumulate
 from math import inf, sqrt
-from random import random, shuffle
-from typing import List, Tuple
+from time import perf_counter
+from random import getrandbits, random, randrange, seed, shuffle
+from typing import Callable, Generator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from models import aco_numpy
+from models.local_search import two_opt
+from models.pheromone_matrix import ScaledPheromoneMatrix
+from models.pheromone_strategies import AntSystem, make_strategy
+from models.symmetric_matrix import SymmetricMatrix
 from utils.path import Path
+from utils.snapshot import IterationSnapshot, Migration
+from utils.stats import SolverStats
 
 
 # Класс реализации муравьиного алгоритма для решения задачи коммивояжера
 class ACOAlgorithm:
     def __init__(self, ants: int = 100, iterations: int = 20,
                  alpha: float = 1.5, beta: float = 1.2,
-                 rho: float = 0.6, q: float = 10):
+                 rho: float = 0.6, q: float = 10, backend: str = "numpy",
+                 candidates: Optional[int] = None, workers: Optional[int] = None,
+                 local_search: Optional[str] = None, local_search_scope: str = "best",
+                 time_budget_s: Optional[float] = None, patience: Optional[int] = None,
+                 strategy: Union[str, AntSystem] = "as", precision: str = "float64",
+                 warm_start_weight: float = 1.0):
+        if backend not in ("numpy", "python"):
+            raise ValueError(f"Unknown backend: {backend}")
+        if precision not in ("float64", "float32"):
+            raise ValueError(f"Unknown precision: {precision}")
+        if candidates is not None and candidates < 1:
+            raise ValueError("Candidate list size must be positive")
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers must be positive")
+        if local_search not in (None, "2opt"):
+            raise ValueError(f"Unknown local search: {local_search}")
+        if local_search_scope not in ("best", "all"):
+            raise ValueError(f"Unknown local search scope: {local_search_scope}")
+        if time_budget_s is not None and time_budget_s <= 0:
+            raise ValueError("Time budget must be positive")
+        if patience is not None and patience < 1:
+            raise ValueError("Patience must be positive")
+        if warm_start_weight < 0:
+            raise ValueError("Warm start weight must be non-negative")
         # Количество муравьев в колонии
         self.ants = ants
         # Количество итераций алгоритма
@@ -21,32 +60,120 @@ class ACOAlgorithm:
         self.rho = rho
         # Константа для количества откладываемого феромона
         self.q = q
+        # Реализация вычислений: "numpy" - на массивах, "python" - эталонная на списках
+        self.backend = backend
+        # Размер списка ближайших соседей для построения пути (None - все точки)
+        self.candidates = candidates
+        # Количество процессов для параллельного построения путей (None - без пула)
+        self.workers = workers
+        # Локальный поиск после построения путей: None или "2opt"
+        self.local_search = local_search
+        # К каким путям применять локальный поиск: "best" - лучший за итерацию, "all" - все
+        self.local_search_scope = local_search_scope
+        # Ограничение времени работы в секундах (проверяется после каждой итерации)
+        self.time_budget_s = time_budget_s
+        # Остановка после заданного числа итераций без улучшения лучшего пути
+        self.patience = patience
+        # Стратегия обновления феромона: "as", "mmas", "acs", "rank" или готовый экземпляр
+        self.strategy = make_strategy(strategy)
+        # Точность хранения матриц в реализации NumPy ("float32" - вдвое меньше памяти)
+        self.precision = precision
+        # Добавка феромона на ребрах известных путей в долях начального уровня
+        self.warm_start_weight = warm_start_weight
 
     # Статический метод для выбора следующей точки на основе вероятностей
     @staticmethod
     def _select_index(selection: List[float]) -> int:
+        # Накопленные суммы весов строятся за один проход
+        cumulative = list(accumulate(selection))
         # Сумма всех вероятностей выбора
-        sum_num = sum(selection)
+        sum_num = cumulative[-1] if cumulative else 0
         # Если все вероятности нулевые, выбираем последний элемент
         if sum_num == 0:
             return len(selection) - 1
-        # Генерация случайного числа для выбора на основе вероятностей
-        tmp_num = random()
-        prob = 0
-        # Накопительное суммирование вероятностей для выбора
-        for i in range(len(selection)):
-            prob += selection[i] / sum_num
-            # Когда накопленная вероятность превышает случайное число - выбираем этот индекс
-            if prob >= tmp_num:
-                return i
-        # Запасной вариант - возвращаем последний индекс
-        return len(selection) - 1
-
-    # Метод создания пути для одного муравья
-    def _create_path(self, distance_matrix: List[List[float]],
-                     pheromone_matrix: List[List[float]]) -> List[int]:
-        # Количество точек (городов)
+        # Двоичный поиск первого индекса, накопленная сумма которого не меньше порога
+        index = bisect_left(cumulative, random() * sum_num)
+        # Запасной вариант при погрешности округления - последний индекс
+        return min(index, len(selection) - 1)
+
+    # Выбор следующей точки с учетом правила стратегии: с вероятностью q0 - лучшая точка,
+    # иначе - рулеточный отбор
+    def _choose_index(self, selection: List[float]) -> int:
+        q0 = self.strategy.q0
+        if q0 and random() < q0:
+            return max(range(len(selection)), key=selection.__getitem__)
+        return self._select_index(selection)
+
+    # Статический метод пакетного выбора: по одному индексу для каждой строки весов
+    @staticmethod
+    def _select_indices(selections: List[List[float]]) -> List[int]:
+        return aco_numpy.select_indices(np.asarray(selections, dtype=np.float64)).tolist()
+
+    # Матрица привлекательности ребер (1/d)^beta, вычисляется один раз на задачу
+    def _build_attractiveness_matrix(self, distance_matrix: List[List[float]]) -> List[List[float]]:
+        if isinstance(distance_matrix, (np.ndarray, SymmetricMatrix)):
+            return aco_numpy.build_attractiveness_matrix(distance_matrix, self.beta,
+                                                         self.precision)
+        return [[(1 / max(d, 10 ** -5)) ** self.beta for d in row]
+                for row in distance_matrix]
+
+    # Матрица выбора tau^alpha * eta^beta, вычисляется один раз за итерацию
+    def _build_choice_info(self, pheromone_matrix: List[List[float]],
+                           attractiveness_matrix: List[List[float]]) -> List[List[float]]:
+        # При отложенном испарении берутся хранимые значения: общий множитель
+        # одинаково масштабирует все веса и не влияет на вероятности выбора
+        if isinstance(pheromone_matrix, ScaledPheromoneMatrix):
+            pheromone_matrix = pheromone_matrix.values
+        if isinstance(pheromone_matrix, np.ndarray):
+            return (pheromone_matrix ** self.alpha) * attractiveness_matrix
+        alpha = self.alpha
+        return [[(pheromone ** alpha) * attractiveness
+                 for pheromone, attractiveness in zip(pheromone_row, attractiveness_row)]
+                for pheromone_row, attractiveness_row in zip(pheromone_matrix, attractiveness_matrix)]
+
+    # Пересчет матрицы выбора на месте только для ребер с изменившимся феромоном
+    def _refresh_choice_info(self, choice_info: List[List[float]],
+                             pheromone_matrix: ScaledPheromoneMatrix,
+                             attractiveness_matrix: List[List[float]]) -> None:
+        values = pheromone_matrix.values
+        if pheromone_matrix.needs_full_refresh:
+            pheromone_matrix.take_dirty_edges()
+            fresh = self._build_choice_info(values, attractiveness_matrix)
+            if isinstance(choice_info, np.ndarray):
+                choice_info[...] = fresh
+            else:
+                choice_info[:] = fresh
+            return
+        rows, cols = pheromone_matrix.take_dirty_edges()
+        if isinstance(choice_info, np.ndarray):
+            choice_info[rows, cols] = (values[rows, cols] ** self.alpha) * \
+                                      attractiveness_matrix[rows, cols]
+            return
+        alpha = self.alpha
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            choice_info[i][j] = (values[i][j] ** alpha) * attractiveness_matrix[i][j]
+
+    # Списки k ближайших соседей каждой точки, отсортированные по расстоянию
+    def _build_candidate_lists(self, distance_matrix: List[List[float]],
+                               size: Optional[int] = None) -> List[List[int]]:
         n = len(distance_matrix)
+        k = min(size or self.candidates, n - 1)
+        if isinstance(distance_matrix, (np.ndarray, SymmetricMatrix)):
+            return aco_numpy.build_candidate_lists(distance_matrix, k)
+        return [sorted((j for j in range(n) if j != i),
+                       key=distance_matrix[i].__getitem__)[:k]
+                for i in range(n)]
+
+    # Метод создания пути для одного муравья по матрице выбора
+    def _create_path(self, choice_info: List[List[float]],
+                     candidate_lists: Optional[List[List[int]]] = None) -> List[int]:
+        # Матрицы NumPy обрабатываются векторизованной реализацией
+        if isinstance(choice_info, np.ndarray):
+            return aco_numpy.create_path(choice_info, candidate_lists, self.strategy.q0)
+        if candidate_lists is not None:
+            return self._create_path_with_candidates(choice_info, candidate_lists)
+        # Количество точек (городов)
+        n = len(choice_info)
         # Список непосещенных точек (изначально все точки)
         unvisited_indices = list(range(n))
         # Перемешиваем точки для случайного начального выбора
@@ -56,21 +183,12 @@ class ACOAlgorithm:
 
         # Посещаем оставшиеся n-1 точек
         for _ in range(n - 1):
-            # Текущая позиция муравья (последняя посещенная точка)
-            i = visited_indices[-1]
-            selection = []
-            # Для каждой непосещенной точки вычисляем вероятность перехода
-            for j in unvisited_indices:
-                # Уровень феромона на ребре i-j
-                pheromone = pheromone_matrix[i][j]
-                # Привлекательность ребра (обратно пропорциональна расстоянию)
-                attractiveness = 1 / max(distance_matrix[i][j], 10 ** -5)
-                # Вычисление вероятности выбора точки j
-                selection.append(
-                    (pheromone ** self.alpha) * (attractiveness ** self.beta)
-                )
+            # Строка матрицы выбора для текущей позиции муравья
+            choice_row = choice_info[visited_indices[-1]]
+            # Вероятности перехода в непосещенные точки - только выборка из матрицы
+            selection = [choice_row[j] for j in unvisited_indices]
             # Выбор следующей точки на основе вероятностей
-            selected_index = self._select_index(selection)
+            selected_index = self._choose_index(selection)
             # Добавляем выбранную точку в путь и удаляем из непосещенных
             visited_indices.append(unvisited_indices.pop(selected_index))
 
@@ -78,21 +196,68 @@ class ACOAlgorithm:
         visited_indices.append(visited_indices[0])
         return visited_indices
 
-    # Метод обновления матрицы феромонов
+    # Создание пути с выбором только среди ближайших непосещенных соседей
+    def _create_path_with_candidates(self, choice_info: List[List[float]],
+                                     candidate_lists: List[List[int]]) -> List[int]:
+        n = len(choice_info)
+        visited = [False] * n
+        # Начинаем путь со случайной точки
+        start = randrange(n)
+        visited[start] = True
+        path = [start]
+
+        for _ in range(n - 1):
+            i = path[-1]
+            choice_row = choice_info[i]
+            # Непосещенные точки из списка кандидатов текущей точки
+            candidates = [j for j in candidate_lists[i] if not visited[j]]
+            if candidates:
+                selection = [choice_row[j] for j in candidates]
+                j = candidates[self._choose_index(selection)]
+            else:
+                # Все кандидаты посещены - идем в лучшую из оставшихся точек
+                j = max((j for j in range(n) if not visited[j]),
+                        key=choice_row.__getitem__)
+            visited[j] = True
+            path.append(j)
+
+        # Замыкаем цикл - возвращаемся в начальную точку
+        path.append(start)
+        return path
+
+    # Метод обновления матрицы феромонов (классическая муравьиная система)
     def _update_pheromone(self, pheromone_matrix: List[List[float]],
                           paths: List[List[int]], lengths: List[float]) -> None:
-        n = len(pheromone_matrix)
-
         # Испарение феромона на всех ребрах
-        for i in range(n):
-            for j in range(n):
-                pheromone_matrix[i][j] *= (1 - self.rho)
-
-        # Добавление нового феромона на основе пройденных путей
-        for k in range(self.ants):
-            # Количество феромона пропорционально качеству пути
-            delta = self.q / lengths[k]
-            path = paths[k]
+        self._evaporate(pheromone_matrix, 1 - self.rho)
+        # Количество феромона пропорционально качеству пути
+        self._deposit(pheromone_matrix, paths, [self.q / length for length in lengths])
+
+    # Испарение: умножение всей матрицы феромонов на коэффициент
+    @staticmethod
+    def _evaporate(pheromone_matrix: List[List[float]], factor: float) -> None:
+        # Отложенное испарение - только изменение общего множителя
+        if isinstance(pheromone_matrix, ScaledPheromoneMatrix):
+            pheromone_matrix.evaporate(factor)
+            return
+        if isinstance(pheromone_matrix, np.ndarray):
+            pheromone_matrix *= factor
+            return
+        for row in pheromone_matrix:
+            for j in range(len(row)):
+                row[j] *= factor
+
+    # Откладывание феромона: каждый путь добавляет свое количество на все свои ребра
+    @staticmethod
+    def _deposit(pheromone_matrix: List[List[float]], paths: List[List[int]],
+                 amounts: List[float]) -> None:
+        if isinstance(pheromone_matrix, ScaledPheromoneMatrix):
+            pheromone_matrix.deposit(paths, amounts)
+            return
+        if isinstance(pheromone_matrix, np.ndarray):
+            aco_numpy.deposit(pheromone_matrix, paths, amounts)
+            return
+        for path, delta in zip(paths, amounts):
             # Обновляем феромон на всех ребрах пройденного пути
             for idx in range(len(path) - 1):
                 i = path[idx]
@@ -100,24 +265,35 @@ class ACOAlgorithm:
                 pheromone_matrix[i][j] += delta
                 pheromone_matrix[j][i] += delta
 
+    # Ограничение значений феромона границами [low, high]
+    @staticmethod
+    def _clip(pheromone_matrix: List[List[float]], low: float, high: float) -> None:
+        if isinstance(pheromone_matrix, ScaledPheromoneMatrix):
+            pheromone_matrix.clip(low, high)
+            return
+        if isinstance(pheromone_matrix, np.ndarray):
+            np.clip(pheromone_matrix, low, high, out=pheromone_matrix)
+            return
+        for row in pheromone_matrix:
+            for j in range(len(row)):
+                row[j] = min(max(row[j], low), high)
+
     # Статический метод вычисления длины пути
     @staticmethod
     def _calculate_path_length(distance_matrix: List[List[float]],
                                path: List[int]) -> float:
+        if isinstance(distance_matrix, (np.ndarray, SymmetricMatrix)):
+            return aco_numpy.calculate_path_length(distance_matrix, path)
         total_length = 0.0
         # Суммируем расстояния между последовательными точками пути
         for i in range(len(path) - 1):
             total_length += distance_matrix[path[i]][path[i + 1]]
         return total_length
 
-    # Основной метод решения задачи коммивояжера
-    def solve_tsp(self, points: List[Tuple[float, float]]) -> Path:
-        # Проверка минимального количества точек
-        if len(points) < 3:
-            raise ValueError("Need at least 3 points for TSP")
-
+    # Статический метод построения матрицы расстояний на списках
+    @staticmethod
+    def _build_distance_matrix(points: List[Tuple[float, float]]) -> List[List[float]]:
         n = len(points)
-
         # Создание матрицы расстояний между всеми парами точек
         distance_matrix = [[0.0] * n for _ in range(n)]
         for i in range(n):
@@ -129,33 +305,310 @@ class ACOAlgorithm:
                 # Матрица симметрична
                 distance_matrix[i][j] = distance
                 distance_matrix[j][i] = distance
+        return distance_matrix
 
-        # Инициализация матрицы феромонов единичными значениями
-        pheromone_matrix = [[1.0] * n for _ in range(n)]
+    # Матрица феромонов с отложенным испарением, заполненная начальным значением.
+    # Матрица расстояний нужна реализациям, хранящим феромон не на всех ребрах
+    def _init_pheromone_matrix(self, n: int, value: float,
+                               distance_matrix: Optional[List[List[float]]] = None
+                               ) -> ScaledPheromoneMatrix:
+        if self.backend == "numpy":
+            return ScaledPheromoneMatrix(np.full((n, n), value, dtype=self.precision))
+        return ScaledPheromoneMatrix([[value] * n for _ in range(n)])
+
+    # Построение путей заданного числа муравьев и вычисление их длин
+    def _construct_paths(self, distance_matrix: List[List[float]],
+                         choice_info: List[List[float]],
+                         candidate_lists: Optional[List[List[int]]],
+                         count: int, neighbour_lists: Optional[List[List[int]]] = None,
+                         local_update: Optional[Callable[[List[int]], None]] = None,
+                         stats: Optional[SolverStats] = None
+                         ) -> Tuple[List[List[int]], List[float]]:
+        improve_all = self.local_search is not None and self.local_search_scope == "all"
+        paths = []
+        lengths = []
+        length_time = 0.0
+        local_search_time = 0.0
+        for _ in range(count):
+            path = self._create_path(choice_info, candidate_lists)
+            # Локальное обновление феромона влияет на следующих муравьев итерации
+            if local_update is not None:
+                local_update(path)
+            started = perf_counter()
+            length = self._calculate_path_length(distance_matrix, path)
+            measured = perf_counter()
+            length_time += measured - started
+            # Локальный поиск для каждого муравья выполняется там же, где строится путь
+            if improve_all:
+                path, length = self._improve_path(path, length, distance_matrix, neighbour_lists)
+                local_search_time += perf_counter() - measured
+            paths.append(path)
+            lengths.append(length)
+        if stats is not None:
+            stats.length_time += length_time
+            stats.local_search_time += local_search_time
+            stats.local_search_calls += count if improve_all else 0
+        return paths, lengths
+
+    # Списки соседей для 2-opt: списки кандидатов или 10 ближайших точек
+    def _build_neighbour_lists(self, distance_matrix: List[List[float]],
+                               candidate_lists: Optional[List[List[int]]]) -> List[List[int]]:
+        if candidate_lists is None:
+            candidate_lists = self._build_candidate_lists(distance_matrix, 10)
+        if isinstance(candidate_lists, np.ndarray):
+            return candidate_lists.tolist()
+        return candidate_lists
+
+    # Улучшение пути выбранным методом локального поиска
+    @staticmethod
+    def _improve_path(path: List[int], length: float, distance_matrix: List[List[float]],
+                      neighbour_lists: List[List[int]]) -> Tuple[List[int], float]:
+        return two_opt(path, length, distance_matrix, neighbour_lists)
+
+    # Распределение муравьев итерации по процессам пула
+    def _construct_parallel(self, pool: ProcessPoolExecutor, choice_info: List[List[float]],
+                            stats: Optional[SolverStats] = None
+                            ) -> Tuple[List[List[int]], List[float]]:
+        base, extra = divmod(self.ants, self.workers)
+        counts = [base + (1 if k < extra else 0) for k in range(self.workers)]
+        # Каждая задача получает собственное зерно - независимый поток случайных чисел
+        futures = [pool.submit(_construct_worker_paths, choice_info, count, getrandbits(64))
+                   for count in counts if count > 0]
+        paths = []
+        lengths = []
+        for future in futures:
+            worker_paths, worker_lengths, worker_stats = future.result()
+            paths.extend(worker_paths)
+            lengths.extend(worker_lengths)
+            if stats is not None:
+                stats.length_time += worker_stats.length_time
+                stats.local_search_time += worker_stats.local_search_time
+                stats.local_search_calls += worker_stats.local_search_calls
+        return paths, lengths
+
+    # Основной метод решения задачи коммивояжера - получает все снимки и возвращает лучший путь
+    def solve_tsp(self, points: List[Tuple[float, float]],
+                  distance_matrix: Optional[List[List[float]]] = None,
+                  warm_start: Optional[List[List[int]]] = None) -> Path:
+        snapshot = None
+        for snapshot in self.solve_tsp_iter(points, distance_matrix, warm_start):
+            pass
+        if snapshot is None:
+            return Path(indices=[], length=inf, name="ACO Solution",
+                        stop_reason="iterations", stop_iteration=0, stats=SolverStats())
+        # Возврат лучшего найденного пути
+        return Path(indices=snapshot.best_path, length=snapshot.best_length,
+                    name="ACO Solution", stop_reason=snapshot.stop_reason,
+                    stop_iteration=snapshot.iteration, stats=snapshot.stats)
+
+    # Пошаговое решение: генератор снимков лучшего решения после каждой итерации.
+    # Вызывающий код может показывать прогресс или прекратить перебор в любой момент,
+    # а через send(Migration(...)) - передать колонии пути и феромон других колоний
+    # Готовая матрица расстояний (например, с весами ребер пользователя) используется
+    # вместо евклидовой без копирования, если ее тип совпадает с реализацией вычислений.
+    # Известные замкнутые пути warm_start (например, лучшие из базы данных) усиливают
+    # феромон на своих ребрах и становятся начальным лучшим решением
+    def solve_tsp_iter(self, points: List[Tuple[float, float]],
+                       distance_matrix: Optional[List[List[float]]] = None,
+                       warm_start: Optional[List[List[int]]] = None
+                       ) -> Generator[IterationSnapshot, Optional[Migration], None]:
+        # Проверка минимального количества точек (сразу, а не при первом шаге генератора)
+        if len(points) < 3:
+            raise ValueError("Need at least 3 points for TSP")
+        if distance_matrix is not None and \
+                (len(distance_matrix) != len(points) or len(distance_matrix[0]) != len(points)):
+            raise ValueError("Distance matrix size must match number of points")
+        for tour in warm_start or []:
+            if len(tour) != len(points) + 1 or tour[0] != tour[-1] or \
+                    sorted(tour[:-1]) != list(range(len(points))):
+                raise ValueError("Warm start tour must visit every point exactly once")
+        return self._iterate(points, distance_matrix, warm_start)
+
+    # Матрица расстояний в формате выбранной реализации вычислений
+    def _prepare_distance_matrix(self, points: List[Tuple[float, float]],
+                                 distance_matrix: Optional[List[List[float]]]) -> List[List[float]]:
+        if distance_matrix is None:
+            if self.backend == "numpy":
+                # Упакованная симметричная матрица: вдвое меньше памяти, чем n x n
+                return SymmetricMatrix.from_points(points, self.precision)
+            return self._build_distance_matrix(points)
+        if self.backend == "numpy":
+            # Массивы и упакованные матрицы используются как есть
+            if isinstance(distance_matrix, (np.ndarray, SymmetricMatrix)):
+                return distance_matrix
+            return np.asarray(distance_matrix, dtype=self.precision)
+        if isinstance(distance_matrix, (np.ndarray, SymmetricMatrix)):
+            return distance_matrix.tolist()
+        return distance_matrix
+
+    # Основной цикл муравьиного алгоритма
+    def _iterate(self, points: List[Tuple[float, float]],
+                 distance_matrix: Optional[List[List[float]]],
+                 warm_start: Optional[List[List[int]]] = None
+                 ) -> Generator[IterationSnapshot, Optional[Migration], None]:
+        n = len(points)
+        # Время и счетчики этапов решения
+        stats = SolverStats()
+        setup_start = perf_counter()
+        # Матрицы расстояний и феромонов в виде массивов NumPy или списков
+        distance_matrix = self._prepare_distance_matrix(points, distance_matrix)
+        # Начальный уровень феромона задает стратегия (классическая система - единицы)
+        initial_pheromone = self.strategy.initial_pheromone(self, distance_matrix)
+        pheromone_matrix = self._init_pheromone_matrix(n, initial_pheromone, distance_matrix)
 
         # Лучший найденный путь и его длина
         best_path = []
         best_length = inf
+        # Теплый старт: ребра известных путей получают дополнительный феромон,
+        # длины пересчитываются по текущей матрице (веса ребер могли измениться)
+        if warm_start:
+            self._deposit(pheromone_matrix, warm_start,
+                          [self.warm_start_weight * initial_pheromone] * len(warm_start))
+            for tour in warm_start:
+                length = self._calculate_path_length(distance_matrix, tour)
+                if length < best_length:
+                    best_length = length
+                    best_path = list(tour)
 
-        # Основной цикл алгоритма по итерациям
-        for iteration in range(self.iterations):
-            paths = []
-            lengths = []
+        # Эвристика не меняется - считаем ее степень один раз на задачу
+        attractiveness_matrix = self._build_attractiveness_matrix(distance_matrix)
+        choice_info = self._build_choice_info(pheromone_matrix, attractiveness_matrix)
+        # Списки кандидатов зависят только от расстояний
+        candidate_lists = None
+        if self.candidates is not None:
+            candidate_lists = self._build_candidate_lists(distance_matrix)
+        # Списки соседей для локального поиска
+        neighbour_lists = None
+        if self.local_search is not None:
+            neighbour_lists = self._build_neighbour_lists(distance_matrix, candidate_lists)
 
-            # Создание путей для всех муравьев в колонии
-            for _ in range(self.ants):
-                path = self._create_path(distance_matrix, pheromone_matrix)
-                length = self._calculate_path_length(distance_matrix, path)
-                paths.append(path)
-                lengths.append(length)
+        # Число итераций без улучшения
+        stale_iterations = 0
+        start_time = perf_counter()
+        stats.setup_time = start_time - setup_start
+
+        # Пул процессов получает неизменные данные задачи один раз при запуске
+        parallel = self.workers is not None and self.workers > 1
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker,
+            initargs=(self, distance_matrix, candidate_lists, neighbour_lists)
+        ) if parallel else nullcontext()
+
+        with pool:
+            # Основной цикл алгоритма по итерациям
+            for iteration in range(self.iterations):
+                # Локальное обновление стратегии меняет феромон и матрицу выбора на ребрах пути
+                local_update = None
+                if self.strategy.has_local_update:
+                    local_update = partial(self.strategy.local_update, self, pheromone_matrix,
+                                           choice_info, attractiveness_matrix)
+                # Создание путей для всех муравьев в колонии; время вычисления длин и
+                # локального поиска учитывается отдельно и вычитается из времени построения
+                phase_start = perf_counter()
+                measured_time = stats.length_time + stats.local_search_time
+                if parallel:
+                    paths, lengths = self._construct_parallel(pool, choice_info, stats)
+                    # Процессы пула строят пути по снимку, локальные обновления
+                    # применяются в основном процессе после получения путей
+                    if local_update is not None:
+                        for path in paths:
+                            local_update(path)
+                else:
+                    paths, lengths = self._construct_paths(
+                        distance_matrix, choice_info, candidate_lists, self.ants,
+                        neighbour_lists, local_update, stats)
+                phase_time = perf_counter() - phase_start
+                if not parallel:
+                    phase_time -= stats.length_time + stats.local_search_time - measured_time
+                stats.construction_time += phase_time
+                stats.tours_built += len(paths)
+                stats.selections += len(paths) * (n - 1)
+
+                # Локальный поиск только для лучшего пути итерации
+                if self.local_search is not None and self.local_search_scope == "best":
+                    phase_start = perf_counter()
+                    k = min(range(len(lengths)), key=lengths.__getitem__)
+                    paths[k], lengths[k] = self._improve_path(
+                        paths[k], lengths[k], distance_matrix, neighbour_lists)
+                    stats.local_search_time += perf_counter() - phase_start
+                    stats.local_search_calls += 1
 
                 # Обновление лучшего решения если найден более короткий путь
-                if length < best_length:
-                    best_length = length
-                    best_path = path
+                improved = False
+                for path, length in zip(paths, lengths):
+                    if length < best_length:
+                        best_length = length
+                        best_path = path
+                        improved = True
+                        stats.improvements += 1
+                if improved:
+                    stats.iteration_of_best = iteration + 1
+                stale_iterations = 0 if improved else stale_iterations + 1
 
-            # Обновление феромонов после завершения итерации
-            self._update_pheromone(pheromone_matrix, paths, lengths)
+                # Обновление феромонов после завершения итерации (в основном процессе)
+                phase_start = perf_counter()
+                self.strategy.update(self, pheromone_matrix, paths, lengths,
+                                     best_path, best_length)
+                # Феромоны изменились - пересчитываем матрицу выбора на измененных ребрах
+                self._refresh_choice_info(choice_info, pheromone_matrix, attractiveness_matrix)
+                stats.pheromone_time += perf_counter() - phase_start
+                stats.iterations = iteration + 1
 
-        # Возврат лучшего найденного пути
-        return Path(indices=best_path, length=best_length, name="ACO Solution")
\ No newline at end of file
+                # Ранняя остановка по застою или по исчерпанию времени
+                elapsed = perf_counter() - start_time
+                stats.total_time = stats.setup_time + elapsed
+                stop_reason = None
+                if self.patience is not None and stale_iterations >= self.patience:
+                    stop_reason = "patience"
+                elif self.time_budget_s is not None and elapsed >= self.time_budget_s:
+                    stop_reason = "time_budget"
+                elif iteration + 1 == self.iterations:
+                    stop_reason = "iterations"
+
+                migration = yield IterationSnapshot(iteration + 1, best_length, best_path,
+                                                    elapsed, stop_reason, pheromone_matrix, stats)
+                if stop_reason is not None:
+                    return
+
+                # Миграция из других колоний (передается через send())
+                if migration is not None:
+                    phase_start = perf_counter()
+                    if migration.pheromone_matrix is not None:
+                        pheromone_matrix.blend(migration.pheromone_matrix, migration.blend_weight)
+                    for path, length in migration.tours:
+                        # Чужой лучший путь откладывает феромон как путь своего муравья
+                        self._deposit(pheromone_matrix, [path], [self.q / length])
+                        if length < best_length:
+                            best_length = length
+                            best_path = path
+                            stats.improvements += 1
+                            stats.iteration_of_best = iteration + 1
+                    self._refresh_choice_info(choice_info, pheromone_matrix, attractiveness_matrix)
+                    stats.pheromone_time += perf_counter() - phase_start
+
+
+# Состояние процесса пула: алгоритм и неизменные данные текущей задачи
+_worker_state = {}
+
+
+# Инициализация процесса пула при запуске
+def _init_worker(algorithm: ACOAlgorithm, distance_matrix: List[List[float]],
+                 candidate_lists: Optional[List[List[int]]],
+                 neighbour_lists: Optional[List[List[int]]]) -> None:
+    _worker_state['algorithm'] = algorithm
+    _worker_state['distance_matrix'] = distance_matrix
+    _worker_state['candidate_lists'] = candidate_lists
+    _worker_state['neighbour_lists'] = neighbour_lists
+
+
+# Построение путей в процессе пула по снимку матрицы выбора; вместе с путями
+# возвращается время вычисления длин и локального поиска в этом процессе
+def _construct_worker_paths(choice_info: List[List[float]], count: int, stream_seed: int
+                            ) -> Tuple[List[List[int]], List[float], SolverStats]:
+    seed(stream_seed)
+    algorithm = _worker_state['algorithm']
+    stats = SolverStats()
+    paths, lengths = algorithm._construct_paths(_worker_state['distance_matrix'], choice_info,
+                                                _worker_state['candidate_lists'], count,
+                                                _worker_state['neighbour_lists'], stats=stats)
+    return paths, lengths, stats
@@ -0,0 +1,160 @@
+from random import random, randrange
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Векторизованные операции муравьиного алгоритма на массивах NumPy.
+# Матрицы расстояний, эвристики и феромонов хранятся как ndarray,
+# а испарение и откладывание феромона выполняются над всем массивом сразу
+
+
+# Построение матрицы евклидовых расстояний без циклов Python
+def build_distance_matrix(points: Sequence[Tuple[float, float]]) -> np.ndarray:
+    coords = np.asarray(points, dtype=np.float64)
+    # Попарные разности координат через broadcasting
+    diff = coords[:, np.newaxis, :] - coords[np.newaxis, :, :]
+    return np.sqrt((diff ** 2).sum(axis=-1))
+
+
+# Матрица эвристической информации (обратное расстояние)
+def build_heuristic_matrix(distance_matrix: np.ndarray) -> np.ndarray:
+    return 1.0 / np.maximum(distance_matrix, 10 ** -5)
+
+
+# Матрица привлекательности (1/d)^beta заданной точности; операции на месте,
+# чтобы не создавать лишних временных матриц n x n
+def build_attractiveness_matrix(distance_matrix, beta: float, dtype=np.float64) -> np.ndarray:
+    # Копия в плотную матрицу (упакованная SymmetricMatrix распаковывается)
+    attractiveness = np.array(distance_matrix, dtype=dtype)
+    np.maximum(attractiveness, 10 ** -5, out=attractiveness)
+    np.reciprocal(attractiveness, out=attractiveness)
+    np.power(attractiveness, beta, out=attractiveness)
+    return attractiveness
+
+
+# Выбор индекса пропорционально весам (рулеточный отбор)
+def select_index(weights: np.ndarray) -> int:
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1]
+    # Если все веса нулевые, выбираем последний элемент
+    if total == 0:
+        return len(weights) - 1
+    # Первый индекс, накопленная сумма которого не меньше случайного порога
+    index = int(np.searchsorted(cumulative, random() * total, side='left'))
+    return min(index, len(weights) - 1)
+
+
+# Выбор с вероятностью q0 лучшего индекса, иначе - рулеточный отбор
+def choose_index(weights: np.ndarray, q0: float = 0.0) -> int:
+    if q0 and random() < q0:
+        return int(np.argmax(weights))
+    return select_index(weights)
+
+
+# Пакетный рулеточный отбор: по одному индексу для каждой строки матрицы весов
+def select_indices(weights: np.ndarray) -> np.ndarray:
+    rows, size = weights.shape
+    cumulative = np.cumsum(weights, axis=1)
+    totals = cumulative[:, -1]
+    empty = totals == 0
+    # Нормированные накопленные суммы строки r лежат в [r, r + 1], поэтому
+    # один двоичный поиск по сплющенному массиву обслуживает все строки сразу
+    scaled = cumulative / np.where(empty, 1.0, totals)[:, np.newaxis]
+    offsets = np.arange(rows, dtype=np.float64)
+    flat = (scaled + offsets[:, np.newaxis]).ravel()
+    draws = offsets + np.array([random() for _ in range(rows)])
+    indices = np.searchsorted(flat, draws, side='left') - offsets.astype(np.intp) * size
+    indices = np.clip(indices, 0, size - 1)
+    # Строки из одних нулей - выбираем последний элемент
+    indices[empty] = size - 1
+    return indices
+
+
+# Списки k ближайших соседей каждой точки (строка i - соседи точки i по возрастанию расстояния)
+# Матрица обрабатывается блоками строк, поэтому дополнительная память - O(n), а не O(n^2)
+def build_candidate_lists(distance_matrix, k: int, block_size: int = 256) -> np.ndarray:
+    n = len(distance_matrix)
+    k = min(k, n - 1)
+    columns = np.arange(n)
+    candidate_lists = np.empty((n, k), dtype=np.intp)
+    for start in range(0, n, block_size):
+        rows = np.arange(start, min(start + block_size, n))
+        # Блок строк (работает и для ndarray, и для упакованной SymmetricMatrix)
+        distances = np.array(distance_matrix[rows[:, np.newaxis], columns], dtype=np.float64)
+        # Точка не может быть собственным соседом
+        distances[np.arange(len(rows)), rows] = np.inf
+        if k < n - 1:
+            # Частичная сортировка: сначала отбираем k ближайших, затем упорядочиваем только их
+            nearest = np.argpartition(distances, k, axis=1)[:, :k]
+        else:
+            nearest = np.broadcast_to(columns, distances.shape)
+        order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1, kind='stable')
+        candidate_lists[rows] = np.take_along_axis(nearest, order, axis=1)[:, :k]
+    return candidate_lists
+
+
+# Создание пути для одного муравья по матрице выбора tau^alpha * eta^beta
+def create_path(choice_info: np.ndarray,
+                candidate_lists: Optional[np.ndarray] = None, q0: float = 0.0) -> List[int]:
+    n = len(choice_info)
+    # Маска непосещенных точек
+    unvisited = np.ones(n, dtype=bool)
+    # Начинаем путь со случайной точки
+    start = randrange(n)
+    unvisited[start] = False
+    path = [start]
+
+    for _ in range(n - 1):
+        i = path[-1]
+        if candidate_lists is not None:
+            # Выбор только среди непосещенных ближайших соседей
+            candidates = candidate_lists[i]
+            candidates = candidates[unvisited[candidates]]
+            if candidates.size:
+                j = int(candidates[choose_index(choice_info[i, candidates], q0)])
+            else:
+                # Все кандидаты посещены - идем в лучшую из оставшихся точек
+                remaining = np.flatnonzero(unvisited)
+                j = int(remaining[np.argmax(choice_info[i, remaining])])
+        else:
+            candidates = np.flatnonzero(unvisited)
+            # Веса перехода во все непосещенные точки - выборка из строки матрицы
+            j = int(candidates[choose_index(choice_info[i, candidates], q0)])
+        unvisited[j] = False
+        path.append(j)
+
+    # Замыкаем цикл - возвращаемся в начальную точку
+    path.append(start)
+    return path
+
+
+# Обновление матрицы феромонов: испарение и откладывание всеми муравьями
+def update_pheromone(pheromone_matrix: np.ndarray, paths: List[List[int]],
+                     lengths: List[float], rho: float, q: float) -> None:
+    # Испарение феромона на всех ребрах
+    pheromone_matrix *= (1 - rho)
+    deposit(pheromone_matrix, paths, [q / length for length in lengths])
+
+
+# Откладывание феромона: каждый путь добавляет свое количество на все свои ребра
+def deposit(pheromone_matrix: np.ndarray, paths: List[List[int]],
+            amounts: List[float]) -> None:
+    if not paths:
+        return
+    # Все ребра всех путей собираем в плоские массивы
+    tours = np.asarray(paths, dtype=np.intp)
+    rows = tours[:, :-1].ravel()
+    cols = tours[:, 1:].ravel()
+    deltas = np.repeat(np.asarray(amounts, dtype=np.float64), tours.shape[1] - 1)
+    # np.add.at корректно суммирует повторяющиеся ребра
+    np.add.at(pheromone_matrix, (rows, cols), deltas)
+    np.add.at(pheromone_matrix, (cols, rows), deltas)
+
+
+# Вычисление длины пути по матрице расстояний
+def calculate_path_length(distance_matrix: np.ndarray, path: Sequence[int]) -> float:
+    if len(path) < 2:
+        return 0.0
+    tour = np.asarray(path, dtype=np.intp)
+    return float(distance_matrix[tour[:-1], tour[1:]].sum())
@@ -1,10 +1,21 @@
 import sqlite3
 import os
+import hashlib
+import struct
 from datetime import datetime
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Sequence, Tuple, Dict, Any
 import json
 from contextlib import contextmanager
 
+
+# Хеш содержимого набора точек (координаты в порядке индексов).
+# Совпадает только для того же набора точек в том же порядке, поэтому
+# сохраненные индексы пути остаются корректными для нового решения
+def hash_points(points: Sequence[Tuple[float, float]]) -> str:
+    coords = [float(value) for point in points for value in point]
+    return hashlib.sha256(struct.pack(f'<{len(coords)}d', *coords)).hexdigest()
+
+
 # Класс для управления базой данных результатов решения задачи коммивояжера (TSP)
 class DatabaseManager:
     def __init__(self, db_path: str = None):
@@ -43,28 +54,39 @@ class DatabaseManager:
                     algorithm_params TEXT NOT NULL,
                     path_length REAL NOT NULL,
                     path_indices TEXT NOT NULL,
-                    computation_time REAL NOT NULL
+                    computation_time REAL NOT NULL,
+                    points_hash TEXT
                 )
             ''')
+            # Базы, созданные до появления хеша точек, получают новый столбец
+            columns = [row[1] for row in cursor.execute('PRAGMA table_info(tsp_results)')]
+            if 'points_hash' not in columns:
+                cursor.execute('ALTER TABLE tsp_results ADD COLUMN points_hash TEXT')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tsp_results_points_hash
+                ON tsp_results (points_hash, path_length)
+            ''')
             conn.commit()
 
     # Сохранение результата решения задачи коммивояжера в базу данных
     def save_result(self, points_count: int, algorithm_params: Dict[str, Any],
                     path_length: float, path_indices: List[int],
-                    computation_time: float):
+                    computation_time: float, points_hash: Optional[str] = None):
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO tsp_results 
-                (timestamp, points_count, algorithm_params, path_length, path_indices, computation_time)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (timestamp, points_count, algorithm_params, path_length, path_indices,
+                 computation_time, points_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
                 datetime.now().isoformat(),
                 points_count,
                 json.dumps(algorithm_params),
                 path_length,
                 json.dumps(path_indices),
-                computation_time
+                computation_time,
+                points_hash
             ))
             conn.commit()
 
@@ -84,4 +106,15 @@ class DatabaseManager:
             cursor.execute('''
                 SELECT * FROM tsp_results WHERE points_count = ? ORDER BY path_length ASC
             ''', (points_count,))
-            return cursor.fetchall()
\ No newline at end of file
+            return cursor.fetchall()
+
+    # Лучшие сохраненные пути для набора точек с заданным хешем (без повторов, по длине)
+    def get_best_tours(self, points_hash: str, limit: int = 3) -> List[Tuple[List[int], float]]:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT path_indices, MIN(path_length) FROM tsp_results
+                WHERE points_hash = ?
+                GROUP BY path_indices ORDER BY MIN(path_length) ASC LIMIT ?
+            ''', (points_hash, limit))
+            return [(json.loads(indices), length) for indices, length in cursor.fetchall()]
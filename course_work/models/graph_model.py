@@ -1,6 +1,8 @@
 from typing import List, Tuple, Optional, Dict
 from math import sqrt
 
+from models.symmetric_matrix import SymmetricMatrix
+
 # Класс, представляющий точку в двумерном пространстве
 class Point:
     def __init__(self, x: float, y: float):
@@ -31,8 +33,8 @@ class GraphModel:
         self.edges: List[Tuple[int, int, float]] = []
         # Словарь для быстрого доступа к весам
         self.edge_weights: Dict[Tuple[int, int], float] = {}
-        # Матрица расстояний между всеми парами точек
-        self.distance_matrix: Optional[List[List[float]]] = None
+        # Матрица расстояний между всеми парами точек (упакованная симметричная)
+        self.distance_matrix: Optional[SymmetricMatrix] = None
         # Минимальное расстояние между точками (в пикселях)
         self.min_distance = 40.0
 
@@ -82,22 +84,11 @@ class GraphModel:
         return self.edge_weights.get((idx1, idx2))
     # Обновление матрицы расстояний между всеми точками
     def _update_distance_matrix(self):
-        # Количество точек в графе
-        n = len(self.points)
-        # Инициализация матрицы нулями
-        self.distance_matrix = [[0.0] * n for _ in range(n)]
-        # Заполнение матрицы расстояний
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Используем пользовательский вес если ребро существует, иначе евклидово расстояние
-                weight = self.get_edge_weight(i, j)
-                if weight is not None:
-                    distance = weight
-                else:
-                    distance = self.points[i].distance_to(self.points[j])
-
-                self.distance_matrix[i][j] = distance
-                self.distance_matrix[j][i] = distance
+        # Евклидовы расстояния между всеми парами точек
+        self.distance_matrix = SymmetricMatrix.from_points(self.get_points())
+        # Используем пользовательский вес если ребро существует
+        for (i, j), weight in self.edge_weights.items():
+            self.distance_matrix[i, j] = weight
 
     def clear(self):
         self.points.clear()
@@ -0,0 +1,95 @@
+from random import randrange
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from models import aco_numpy
+from models.aco_algorithm import ACOAlgorithm
+from models.pheromone_matrix import CandidatePheromoneMatrix
+from models.spatial_index import CoordinateDistances
+
+
+# Муравьиный алгоритм для больших задач (десятки тысяч точек) без матриц n x n.
+# Расстояния вычисляются по координатам, списки кандидатов строятся по сетке,
+# а феромон, привлекательность и матрица выбора хранятся только для ребер из
+# списков кандидатов (n x k). Основной цикл, стратегии, ранняя остановка и
+# локальный поиск - те же, что у ACOAlgorithm; память растет линейно по n
+class LargeInstanceACO(ACOAlgorithm):
+    def __init__(self, candidates: int = 10, **params):
+        super().__init__(candidates=candidates, **params)
+        if self.backend != "numpy":
+            raise ValueError("Large-instance mode requires the numpy backend")
+
+    # Расстояния по координатам вместо матрицы; готовая матрица здесь не поддерживается
+    def _prepare_distance_matrix(self, points: List[Tuple[float, float]],
+                                 distance_matrix: Optional[List[List[float]]]
+                                 ) -> CoordinateDistances:
+        if distance_matrix is not None:
+            raise ValueError("Large-instance mode computes distances from coordinates")
+        return CoordinateDistances(points, self.candidates)
+
+    # Феромон только на ребрах из списков кандидатов
+    def _init_pheromone_matrix(self, n: int, value: float,
+                               distance_matrix: Optional[CoordinateDistances] = None
+                               ) -> CandidatePheromoneMatrix:
+        return CandidatePheromoneMatrix(distance_matrix.candidate_lists, value, self.precision)
+
+    # Привлекательность (1/d)^beta ребер из списков кандидатов (n x k)
+    def _build_attractiveness_matrix(self, distance_matrix: CoordinateDistances) -> np.ndarray:
+        return aco_numpy.build_attractiveness_matrix(distance_matrix.candidate_distances,
+                                                     self.beta, self.precision)
+
+    # Списки кандидатов уже найдены при подготовке расстояний
+    def _build_candidate_lists(self, distance_matrix: CoordinateDistances,
+                               size: Optional[int] = None) -> np.ndarray:
+        return distance_matrix.candidate_lists
+
+    @staticmethod
+    def _calculate_path_length(distance_matrix: CoordinateDistances, path: List[int]) -> float:
+        return distance_matrix.tour_length(path)
+
+    # Создание пути: выбор среди непосещенных кандидатов, а если все они посещены -
+    # переход в ближайшую непосещенную точку по координатам
+    def _create_candidate_path(self, distance_matrix: CoordinateDistances,
+                               choice_info: np.ndarray) -> List[int]:
+        candidate_lists = distance_matrix.candidate_lists
+        q0 = self.strategy.q0
+        n = len(choice_info)
+        unvisited = np.ones(n, dtype=bool)
+        start = randrange(n)
+        unvisited[start] = False
+        path = [start]
+        i = start
+        for _ in range(n - 1):
+            free = unvisited[candidate_lists[i]]
+            if free.any():
+                # Строка матрицы выбора относится к кандидатам точки i
+                k = aco_numpy.choose_index(choice_info[i][free], q0)
+                j = int(candidate_lists[i][free][k])
+            else:
+                j = distance_matrix.nearest_unvisited(i, unvisited)
+            unvisited[j] = False
+            path.append(j)
+            i = j
+        path.append(start)
+        return path
+
+    def _construct_paths(self, distance_matrix: CoordinateDistances,
+                         choice_info: np.ndarray,
+                         candidate_lists: Optional[np.ndarray],
+                         count: int, neighbour_lists: Optional[List[List[int]]] = None,
+                         local_update: Optional[Callable[[List[int]], None]] = None
+                         ) -> Tuple[List[List[int]], List[float]]:
+        improve_all = self.local_search is not None and self.local_search_scope == "all"
+        paths = []
+        lengths = []
+        for _ in range(count):
+            path = self._create_candidate_path(distance_matrix, choice_info)
+            if local_update is not None:
+                local_update(path)
+            length = distance_matrix.tour_length(path)
+            if improve_all:
+                path, length = self._improve_path(path, length, distance_matrix, neighbour_lists)
+            paths.append(path)
+            lengths.append(length)
+        return paths, lengths
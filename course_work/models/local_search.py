@@ -0,0 +1,84 @@
+from collections import deque
+from typing import List, Sequence, Tuple
+
+
+# Локальный поиск 2-opt для улучшения замкнутых маршрутов.
+# Перебор ограничен списками ближайших соседей, а биты "не смотреть"
+# (don't-look bits) исключают точки, вокруг которых улучшений не нашлось,
+# поэтому один проход выполняется быстрее, чем за O(n^2)
+
+# Минимальное улучшение, которое считается значимым (защита от зацикливания)
+EPSILON = 1e-10
+
+
+# Улучшение пути 2-opt; возвращает новый замкнутый путь и его длину
+def two_opt(path: List[int], length: float, distance_matrix: Sequence[Sequence[float]],
+            neighbour_lists: Sequence[Sequence[int]]) -> Tuple[List[int], float]:
+    # Работаем с незамкнутым порядком обхода и позициями точек в нем
+    tour = list(path[:-1])
+    n = len(tour)
+    if n < 4:
+        return path, length
+    position = [0] * n
+    for index, city in enumerate(tour):
+        position[city] = index
+
+    # Очередь точек со сброшенным битом "не смотреть"
+    queue = deque(tour)
+    queued = [True] * n
+
+    # Разворот участка маршрута между позициями first и last (по ходу обхода)
+    def reverse(first: int, last: int) -> None:
+        size = (last - first) % n + 1
+        # Разворот дополнения дает тот же цикл, выбираем более короткий участок
+        if 2 * size > n:
+            first, last = (last + 1) % n, (first - 1) % n
+            size = n - size
+        for _ in range(size // 2):
+            a, b = tour[first], tour[last]
+            tour[first], tour[last] = b, a
+            position[b], position[a] = first, last
+            first = (first + 1) % n
+            last = (last - 1) % n
+
+    # Поиск улучшающего хода для точки a; возвращает затронутые точки
+    def improve_city(a: int) -> Tuple[float, Tuple[int, ...]]:
+        i = position[a]
+        d = distance_matrix
+        for successor in (True, False):
+            # Соседнее с a ребро маршрута: (a, succ(a)) или (pred(a), a)
+            b = tour[(i + 1) % n] if successor else tour[(i - 1) % n]
+            d_ab = d[a][b]
+            for c in neighbour_lists[a]:
+                d_ac = d[a][c]
+                # Соседи отсортированы: дальше новое ребро только длиннее
+                if d_ac >= d_ab:
+                    break
+                j = position[c]
+                e = tour[(j + 1) % n] if successor else tour[(j - 1) % n]
+                if c == b or e == a:
+                    continue
+                # Изменение длины за O(1): два новых ребра минус два удаленных
+                delta = d_ac + d[b][e] - d_ab - d[c][e]
+                if delta < -EPSILON:
+                    if successor:
+                        reverse(position[b], j)
+                    else:
+                        reverse(i, position[e])
+                    return delta, (a, b, c, e)
+        return 0.0, ()
+
+    while queue:
+        a = queue.popleft()
+        queued[a] = False
+        delta, touched = improve_city(a)
+        if touched:
+            length += delta
+            # Концы измененных ребер снова становятся активными
+            for city in touched:
+                if not queued[city]:
+                    queued[city] = True
+                    queue.append(city)
+
+    tour.append(tour[0])
+    return tour, float(length)
@@ -0,0 +1,102 @@
+import multiprocessing
+from math import inf
+from random import getrandbits, seed
+from typing import List, Optional, Tuple
+
+from models.aco_algorithm import ACOAlgorithm
+from utils.path import Path
+from utils.snapshot import Migration
+
+
+# Островная модель: несколько независимых колоний в отдельных процессах.
+# У каждой колонии своя матрица феромонов; каждые migration_interval итераций
+# колония отправляет соседней по кольцу свой лучший путь (или матрицу феромонов
+# для смешивания) через очередь и получает данные от предыдущей колонии
+class MultiColonyACO:
+    def __init__(self, colonies: int = 4, migration_interval: int = 5,
+                 migration: str = "tours", blend_weight: float = 0.2, **params):
+        if colonies < 1:
+            raise ValueError("Number of colonies must be positive")
+        if migration_interval < 1:
+            raise ValueError("Migration interval must be positive")
+        if migration not in ("tours", "pheromone"):
+            raise ValueError(f"Unknown migration: {migration}")
+        # Количество колоний (процессов)
+        self.colonies = colonies
+        # Через сколько итераций колонии обмениваются данными
+        self.migration_interval = migration_interval
+        # Что передается соседу: "tours" - лучший путь, "pheromone" - матрица для смешивания
+        self.migration = migration
+        # Доля феромона соседа при смешивании
+        self.blend_weight = blend_weight
+        # Параметры муравьиного алгоритма каждой колонии (проверяются сразу)
+        ACOAlgorithm(**params)
+        self.params = params
+
+    # Решение задачи всеми колониями; возвращается лучший путь среди колоний
+    def solve_tsp(self, points: List[Tuple[float, float]],
+                  distance_matrix: Optional[List[List[float]]] = None) -> Path:
+        if len(points) < 3:
+            raise ValueError("Need at least 3 points for TSP")
+
+        context = multiprocessing.get_context()
+        # Кольцо очередей: колония k пишет в очередь k, колония k + 1 читает из нее
+        channels = [context.Queue() for _ in range(self.colonies)]
+        results = context.Queue()
+        processes = [
+            context.Process(target=_run_colony, args=(
+                k, self, points, distance_matrix, getrandbits(64),
+                channels[k - 1], channels[k], results))
+            for k in range(self.colonies)
+        ]
+        for process in processes:
+            process.start()
+        # Результаты забираются до join, чтобы процессы не ждали освобождения очереди
+        colony_results = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        best_path, best_length, stop_reason, iterations = [], inf, None, 0
+        for path, length, iteration, reason in colony_results:
+            iterations = max(iterations, iteration)
+            if length < best_length:
+                best_path, best_length, stop_reason = path, length, reason
+        return Path(indices=best_path, length=best_length, name="ACO Multi-Colony Solution",
+                    stop_reason=stop_reason, stop_iteration=iterations)
+
+
+# Работа одной колонии в отдельном процессе
+def _run_colony(index: int, solver: MultiColonyACO, points: List[Tuple[float, float]],
+                distance_matrix: Optional[List[List[float]]], stream_seed: int,
+                inbox, outbox, results) -> None:
+    # Собственный поток случайных чисел колонии
+    seed(stream_seed)
+    algorithm = ACOAlgorithm(**solver.params)
+    iterator = algorithm.solve_tsp_iter(points, distance_matrix)
+    # Пока сосед работает, на каждой точке миграции от него приходит одно сообщение
+    neighbour_active = True
+    snapshot = next(iterator)
+    while snapshot.stop_reason is None:
+        if snapshot.iteration % solver.migration_interval != 0:
+            snapshot = next(iterator)
+            continue
+        if solver.migration == "pheromone":
+            outbox.put(snapshot.pheromone_matrix.to_matrix())
+        else:
+            outbox.put((snapshot.best_path, snapshot.best_length))
+        migration = None
+        if neighbour_active:
+            message = inbox.get()
+            if message is None:
+                # Сосед завершил работу - больше сообщений не будет
+                neighbour_active = False
+            elif solver.migration == "pheromone":
+                migration = Migration(pheromone_matrix=message,
+                                      blend_weight=solver.blend_weight)
+            else:
+                migration = Migration(tours=[message])
+        snapshot = iterator.send(migration)
+    # Сообщаем соседу о завершении и отдаем результат
+    outbox.put(None)
+    results.put((snapshot.best_path, snapshot.best_length, snapshot.iteration,
+                 snapshot.stop_reason))
@@ -0,0 +1,216 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from models import aco_numpy
+
+
+# Порог общего множителя, ниже которого матрица нормализуется. Хранимые значения
+# растут как 1 / scale и затем возводятся в степень alpha, поэтому порог выбран
+# с большим запасом до переполнения, а не у самой границы float
+UNDERFLOW_LIMIT = 1e-50
+# Порог для значений float32 (максимум около 3e38)
+FLOAT32_UNDERFLOW_LIMIT = 1e-4
+
+
+# Матрица феромонов с отложенным испарением.
+# Истинное значение феромона равно scale * values[i][j]: испарение меняет только
+# общий множитель scale, а откладываемое количество делится на него. Поэтому
+# стоимость обновления зависит от числа ребер с новым феромоном, а не от n^2.
+# Ребра, значения которых изменились, запоминаются, чтобы матрица выбора
+# пересчитывалась только на них
+class ScaledPheromoneMatrix:
+    def __init__(self, values, scale: float = 1.0):
+        # Хранимые значения (список списков или массив NumPy)
+        self.values = values
+        # Общий множитель всех значений
+        self.scale = scale
+        # Порог нормализации зависит от точности хранимых значений
+        self.underflow_limit = FLOAT32_UNDERFLOW_LIMIT \
+            if getattr(values, 'dtype', None) == np.float32 else UNDERFLOW_LIMIT
+        # Ребра, измененные с последнего пересчета матрицы выбора
+        self._dirty_edges: List[Tuple[int, int]] = []
+        self._dirty_rows: List[np.ndarray] = []
+        self._dirty_cols: List[np.ndarray] = []
+        # Требуется ли полный пересчет матрицы выбора
+        self.needs_full_refresh = False
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    # Доступ к строке с истинными значениями: matrix[i][j]
+    def __getitem__(self, i: int) -> '_ScaledRow':
+        return _ScaledRow(self, i)
+
+    # Истинные значения феромона в виде обычной матрицы
+    def to_matrix(self):
+        if isinstance(self.values, np.ndarray):
+            return self.values * self.scale
+        return [[value * self.scale for value in row] for row in self.values]
+
+    # Испарение - изменение только общего множителя
+    def evaporate(self, factor: float) -> None:
+        if factor == 0:
+            # Полное испарение обнуляет матрицу
+            self._multiply_values(0.0)
+            self.scale = 1.0
+            self.needs_full_refresh = True
+            return
+        self.scale *= factor
+        if self.scale < self.underflow_limit:
+            self.normalize()
+
+    # Перенос общего множителя в значения (редкая операция за O(n^2))
+    def normalize(self) -> None:
+        self._multiply_values(self.scale)
+        self.scale = 1.0
+        self.needs_full_refresh = True
+
+    # Откладывание феромона: количество делится на общий множитель
+    def deposit(self, paths: List[List[int]], amounts: List[float]) -> None:
+        scaled_amounts = [amount / self.scale for amount in amounts]
+        if isinstance(self.values, np.ndarray):
+            aco_numpy.deposit(self.values, paths, scaled_amounts)
+            if paths:
+                tours = np.asarray(paths, dtype=np.intp)
+                self._dirty_rows.append(tours[:, :-1].ravel())
+                self._dirty_cols.append(tours[:, 1:].ravel())
+            return
+        values = self.values
+        for path, delta in zip(paths, scaled_amounts):
+            for i, j in zip(path, path[1:]):
+                values[i][j] += delta
+                values[j][i] += delta
+                self._dirty_edges.append((i, j))
+
+    # Ограничение истинных значений границами [low, high]
+    def clip(self, low: float, high: float) -> None:
+        low, high = low / self.scale, high / self.scale
+        if isinstance(self.values, np.ndarray):
+            np.clip(self.values, low, high, out=self.values)
+        else:
+            for row in self.values:
+                for j in range(len(row)):
+                    row[j] = min(max(row[j], low), high)
+        self.needs_full_refresh = True
+
+    # Смешивание с истинными значениями другой матрицы: (1 - weight) * tau + weight * other
+    def blend(self, other, weight: float) -> None:
+        if isinstance(self.values, np.ndarray):
+            self.values *= (1 - weight)
+            self.values += np.asarray(other, dtype=self.values.dtype) * (weight / self.scale)
+        else:
+            for row, other_row in zip(self.values, other):
+                for j in range(len(row)):
+                    row[j] = (1 - weight) * row[j] + weight * other_row[j] / self.scale
+        self.needs_full_refresh = True
+
+    # Запись истинного значения на ребре i-j
+    def set(self, i: int, j: int, value: float) -> None:
+        self.values[i][j] = value / self.scale
+        self._dirty_edges.append((i, j))
+
+    # Измененные ребра (в обоих направлениях) с очисткой списка
+    def take_dirty_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        rows = self._dirty_rows + [np.fromiter((i for i, _ in self._dirty_edges), dtype=np.intp)]
+        cols = self._dirty_cols + [np.fromiter((j for _, j in self._dirty_edges), dtype=np.intp)]
+        self._dirty_edges = []
+        self._dirty_rows = []
+        self._dirty_cols = []
+        self.needs_full_refresh = False
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        return np.concatenate((rows, cols)), np.concatenate((cols, rows))
+
+    # Умножение всех хранимых значений на число
+    def _multiply_values(self, factor: float) -> None:
+        if isinstance(self.values, np.ndarray):
+            self.values *= factor
+            return
+        for row in self.values:
+            for j in range(len(row)):
+                row[j] *= factor
+
+
+# Строка матрицы феромонов с пересчетом через общий множитель
+class _ScaledRow:
+    def __init__(self, matrix: ScaledPheromoneMatrix, i: int):
+        self.matrix = matrix
+        self.i = i
+
+    def __len__(self) -> int:
+        return len(self.matrix.values[self.i])
+
+    def __getitem__(self, j: int) -> float:
+        return self.matrix.values[self.i][j] * self.matrix.scale
+
+    def __setitem__(self, j: int, value: float) -> None:
+        self.matrix.set(self.i, j, value)
+
+
+# Матрица феромонов только для ребер из списков кандидатов (n x k вместо n x n).
+# values[i][s] - феромон на ребре от i к candidate_lists[i][s]. Ребро i-j
+# хранится в строке i и в строке j, если каждая точка есть в списке другой;
+# ребра вне списков кандидатов феромона не имеют. Испарение, ограничение и
+# смешивание наследуются: они не зависят от того, каким ребрам отвечают значения
+class CandidatePheromoneMatrix(ScaledPheromoneMatrix):
+    def __init__(self, candidate_lists: np.ndarray, value: float, dtype=np.float64):
+        super().__init__(np.full(candidate_lists.shape, value, dtype=dtype))
+        # Списки кандидатов, задающие ребра каждой строки
+        self.candidate_lists = candidate_lists
+
+    # Истинное значение на ребре i-j (0, если ребра нет в списке кандидатов i)
+    def __getitem__(self, i: int) -> '_CandidateRow':
+        return _CandidateRow(self, i)
+
+    # Есть ли ребро (rows[t], cols[t]) в списке кандидатов и его позиция в строке
+    def _slots(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        matches = self.candidate_lists[rows] == cols[:, np.newaxis]
+        return matches.any(axis=1), matches.argmax(axis=1)
+
+    def deposit(self, paths: List[List[int]], amounts: List[float]) -> None:
+        if not paths:
+            return
+        tours = np.asarray(paths, dtype=np.intp)
+        starts, ends = tours[:, :-1].ravel(), tours[:, 1:].ravel()
+        deltas = np.repeat(np.asarray(amounts, dtype=np.float64) / self.scale, tours.shape[1] - 1)
+        # Оба направления ребра: строка начала и строка конца
+        rows = np.concatenate((starts, ends))
+        cols = np.concatenate((ends, starts))
+        # Ребра вне списков кандидатов отбрасываются
+        found, slots = self._slots(rows, cols)
+        rows, slots = rows[found], slots[found]
+        np.add.at(self.values, (rows, slots), np.concatenate((deltas, deltas))[found])
+        self._dirty_rows.append(rows)
+        self._dirty_cols.append(slots)
+
+    def set(self, i: int, j: int, value: float) -> None:
+        found, slots = self._slots(np.array([i]), np.array([j]))
+        if found[0]:
+            self.values[i, slots[0]] = value / self.scale
+            self._dirty_rows.append(np.array([i]))
+            self._dirty_cols.append(slots)
+
+    # Измененные позиции (строка, номер кандидата); обе стороны ребра уже учтены при записи
+    def take_dirty_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        rows = np.concatenate(self._dirty_rows + [np.empty(0, dtype=np.intp)])
+        slots = np.concatenate(self._dirty_cols + [np.empty(0, dtype=np.intp)])
+        self._dirty_rows = []
+        self._dirty_cols = []
+        self.needs_full_refresh = False
+        return rows, slots
+
+
+# Строка разреженной матрицы феромонов для доступа вида matrix[i][j]
+class _CandidateRow:
+    def __init__(self, matrix: CandidatePheromoneMatrix, i: int):
+        self.matrix = matrix
+        self.i = i
+
+    def __getitem__(self, j: int) -> float:
+        found, slots = self.matrix._slots(np.array([self.i]), np.array([j]))
+        if not found[0]:
+            return 0.0
+        return float(self.matrix.values[self.i, slots[0]]) * self.matrix.scale
+
+    def __setitem__(self, j: int, value: float) -> None:
+        self.matrix.set(self.i, j, value)
@@ -0,0 +1,150 @@
+from typing import List, Optional, Sequence
+
+from models.spatial_index import CoordinateDistances
+
+
+# Стратегии обновления феромона муравьиного алгоритма.
+# Стратегия задает начальный уровень феромона, глобальное обновление после
+# итерации и, при необходимости, локальное обновление после пути каждого муравья.
+# Матрица феромонов - ScaledPheromoneMatrix с отложенным испарением (или обычная
+# матрица): операции над всей матрицей выполняет сам алгоритм (_evaporate, _deposit)
+
+
+# Длина жадного пути "ближайший сосед" из точки 0 (оценка порядка длины оптимального пути)
+def nearest_neighbour_length(distance_matrix: Sequence[Sequence[float]]) -> float:
+    # Для больших задач путь строится по спискам кандидатов без полной матрицы
+    if isinstance(distance_matrix, CoordinateDistances):
+        return distance_matrix.nearest_neighbour_length()
+    n = len(distance_matrix)
+    visited = [False] * n
+    visited[0] = True
+    current = 0
+    length = 0.0
+    for _ in range(n - 1):
+        row = distance_matrix[current]
+        nearest = min((j for j in range(n) if not visited[j]), key=row.__getitem__)
+        length += row[nearest]
+        visited[nearest] = True
+        current = nearest
+    return length + distance_matrix[current][0]
+
+
+# Базовая стратегия - классическая муравьиная система (Ant System):
+# испарение на всех ребрах и откладывание феромона каждым муравьем
+class AntSystem:
+    # Вероятность жадного выбора лучшей точки при построении пути
+    q0 = 0.0
+    # Выполняется ли локальное обновление после пути каждого муравья
+    has_local_update = False
+
+    # Начальный уровень феромона на всех ребрах
+    def initial_pheromone(self, algorithm, distance_matrix) -> float:
+        return 1.0
+
+    # Глобальное обновление феромона после итерации
+    def update(self, algorithm, pheromone_matrix, paths: List[List[int]],
+               lengths: List[float], best_path: List[int], best_length: float) -> None:
+        algorithm._update_pheromone(pheromone_matrix, paths, lengths)
+
+    # Локальное обновление после пути одного муравья (в базовой стратегии отсутствует)
+    def local_update(self, algorithm, pheromone_matrix, choice_info,
+                     attractiveness_matrix, path: List[int]) -> None:
+        pass
+
+
+# MAX-MIN Ant System: феромон откладывает только лучший муравей итерации,
+# а значения ограничены снизу и сверху границами tau_min и tau_max
+class MaxMinAntSystem(AntSystem):
+    def __init__(self, min_ratio: Optional[float] = None):
+        # Отношение tau_min / tau_max (по умолчанию 1 / (2n))
+        self.min_ratio = min_ratio
+
+    # Начинаем с оценки верхней границы - это поощряет исследование
+    def initial_pheromone(self, algorithm, distance_matrix) -> float:
+        return algorithm.q / (algorithm.rho * nearest_neighbour_length(distance_matrix))
+
+    def update(self, algorithm, pheromone_matrix, paths: List[List[int]],
+               lengths: List[float], best_path: List[int], best_length: float) -> None:
+        n = len(pheromone_matrix)
+        algorithm._evaporate(pheromone_matrix, 1 - algorithm.rho)
+        # Откладывает только лучший муравей итерации
+        k = min(range(len(lengths)), key=lengths.__getitem__)
+        algorithm._deposit(pheromone_matrix, [paths[k]], [algorithm.q / lengths[k]])
+        # Границы пересчитываются по лучшему найденному пути
+        tau_max = algorithm.q / (algorithm.rho * best_length)
+        tau_min = tau_max * (self.min_ratio if self.min_ratio is not None else 1 / (2 * n))
+        algorithm._clip(pheromone_matrix, tau_min, tau_max)
+
+
+# Ant Colony System: псевдослучайное пропорциональное правило выбора (q0),
+# локальное обновление после каждого муравья и глобальное - только по лучшему пути
+class AntColonySystem(AntSystem):
+    has_local_update = True
+
+    def __init__(self, q0: float = 0.9, xi: float = 0.1):
+        # Вероятность жадного выбора лучшей точки
+        self.q0 = q0
+        # Коэффициент локального испарения
+        self.xi = xi
+        # Начальный уровень феромона, задается при запуске решения
+        self.tau0 = 1.0
+
+    def initial_pheromone(self, algorithm, distance_matrix) -> float:
+        n = len(distance_matrix)
+        self.tau0 = algorithm.q / (n * nearest_neighbour_length(distance_matrix))
+        return self.tau0
+
+    # Глобальное обновление только на ребрах лучшего найденного пути
+    def update(self, algorithm, pheromone_matrix, paths: List[List[int]],
+               lengths: List[float], best_path: List[int], best_length: float) -> None:
+        rho = algorithm.rho
+        delta = rho * algorithm.q / best_length
+        for i, j in zip(best_path, best_path[1:]):
+            value = (1 - rho) * pheromone_matrix[i][j] + delta
+            pheromone_matrix[i][j] = value
+            pheromone_matrix[j][i] = value
+
+    # Локальное испарение к tau0 на ребрах пути; матрица выбора обновляется только на них
+    def local_update(self, algorithm, pheromone_matrix, choice_info,
+                     attractiveness_matrix, path: List[int]) -> None:
+        for i, j in zip(path, path[1:]):
+            value = (1 - self.xi) * pheromone_matrix[i][j] + self.xi * self.tau0
+            pheromone_matrix[i][j] = value
+            pheromone_matrix[j][i] = value
+        algorithm._refresh_choice_info(choice_info, pheromone_matrix, attractiveness_matrix)
+
+
+# Ранговая муравьиная система: откладывают только (w - 1) лучших муравьев итерации
+# с весом, убывающим по рангу, и лучший найденный путь с весом w
+class RankBasedAntSystem(AntSystem):
+    def __init__(self, weight: int = 6):
+        # Число учитываемых рангов w
+        self.weight = weight
+
+    def update(self, algorithm, pheromone_matrix, paths: List[List[int]],
+               lengths: List[float], best_path: List[int], best_length: float) -> None:
+        algorithm._evaporate(pheromone_matrix, 1 - algorithm.rho)
+        ranked = sorted(range(len(lengths)), key=lengths.__getitem__)[:self.weight - 1]
+        deposit_paths = [paths[k] for k in ranked] + [best_path]
+        amounts = [(self.weight - rank - 1) * algorithm.q / lengths[k]
+                   for rank, k in enumerate(ranked)]
+        amounts.append(self.weight * algorithm.q / best_length)
+        algorithm._deposit(pheromone_matrix, deposit_paths, amounts)
+
+
+# Встроенные стратегии, доступные по имени
+STRATEGIES = {
+    "as": AntSystem,
+    "mmas": MaxMinAntSystem,
+    "acs": AntColonySystem,
+    "rank": RankBasedAntSystem,
+}
+
+
+# Получение стратегии по имени или готового экземпляра
+def make_strategy(strategy) -> AntSystem:
+    if isinstance(strategy, AntSystem):
+        return strategy
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown pheromone strategy: {strategy}")
+    return STRATEGIES[strategy]()
@@ -0,0 +1,143 @@
+from math import hypot
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+# Пространственный индекс и расстояния по координатам для больших задач.
+# Матрица расстояний n x n не строится: соседи ищутся по равномерной сетке,
+# а любое расстояние вычисляется по координатам в момент обращения.
+# Вся дополнительная память - O(n)
+
+
+# Равномерная сетка: точки упорядочены по номеру ячейки, поэтому точки
+# одного столбца сетки в диапазоне строк лежат в одном непрерывном отрезке
+class GridIndex:
+    def __init__(self, points: Sequence[Tuple[float, float]], leaf_size: int = 8):
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        n = len(coords)
+        # Координаты точек
+        self.coords = coords
+        # Число ячеек по каждой оси (в среднем leaf_size точек на ячейку)
+        self.side = max(1, int(np.sqrt(n / leaf_size)))
+        low = coords.min(axis=0) if n else np.zeros(2)
+        span = float((coords.max(axis=0) - low).max()) if n else 0.0
+        # Размер ячейки (для совпадающих точек - любой положительный)
+        self.cell_size = span / self.side if span > 0 else 1.0
+        # Ячейка каждой точки по осям x и y
+        self.cells = np.minimum(((coords - low) / self.cell_size).astype(np.intp), self.side - 1)
+        cell_ids = self.cells[:, 0] * self.side + self.cells[:, 1]
+        # Точки, упорядоченные по номеру ячейки, и начало каждой ячейки в этом порядке
+        self.order = np.argsort(cell_ids, kind='stable')
+        self.cell_start = np.searchsorted(cell_ids[self.order], np.arange(self.side ** 2 + 1))
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    # Точки в квадрате ячеек со стороной 2r + 1 вокруг ячейки (x, y)
+    def _points_in_block(self, x: int, y: int, r: int) -> np.ndarray:
+        side = self.side
+        y0, y1 = max(y - r, 0), min(y + r, side - 1)
+        segments = [self.order[self.cell_start[column * side + y0]:
+                               self.cell_start[column * side + y1 + 1]]
+                    for column in range(max(x - r, 0), min(x + r, side - 1) + 1)]
+        return np.concatenate(segments)
+
+    # Списки k ближайших соседей каждой точки (по возрастанию расстояния) и расстояния до них.
+    # Квадрат ячеек расширяется, пока k-й сосед не окажется ближе его границы -
+    # тогда точки вне квадрата заведомо дальше и результат точный
+    def nearest_neighbours(self, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        n = len(self.coords)
+        k = min(k, n - 1)
+        neighbours = np.empty((n, k), dtype=np.intp)
+        distances = np.empty((n, k), dtype=np.float64)
+        side = self.side
+        for cell in np.flatnonzero(np.diff(self.cell_start)):
+            members = self.order[self.cell_start[cell]:self.cell_start[cell + 1]]
+            x, y = divmod(int(cell), side)
+            r = 1
+            while True:
+                block = self._points_in_block(x, y, r)
+                covers_all = r >= side
+                if len(block) > k or covers_all:
+                    diff = self.coords[block] - self.coords[members, np.newaxis]
+                    block_distances = np.sqrt((diff ** 2).sum(axis=-1))
+                    # Точка не может быть собственным соседом
+                    block_distances[block[np.newaxis, :] == members[:, np.newaxis]] = np.inf
+                    nearest = np.argpartition(block_distances, k - 1, axis=1)[:, :k]
+                    nearest_distances = np.take_along_axis(block_distances, nearest, axis=1)
+                    if covers_all or nearest_distances.max() <= r * self.cell_size:
+                        break
+                r += 1
+            order = np.argsort(nearest_distances, axis=1, kind='stable')
+            neighbours[members] = block[np.take_along_axis(nearest, order, axis=1)]
+            distances[members] = np.take_along_axis(nearest_distances, order, axis=1)
+        return neighbours, distances
+
+
+# Евклидовы расстояния по координатам с тем же доступом, что у матрицы: d[i][j].
+# Хранит списки кандидатов и расстояния до них, найденные по сетке
+class CoordinateDistances:
+    def __init__(self, points: Sequence[Tuple[float, float]], k: int):
+        index = GridIndex(points)
+        # Координаты точек
+        self.coords = index.coords
+        # Координаты в списках Python для быстрого доступа к отдельным точкам
+        self._xs = self.coords[:, 0].tolist()
+        self._ys = self.coords[:, 1].tolist()
+        # Списки k ближайших соседей и расстояния до них (n x k)
+        self.candidate_lists, self.candidate_distances = index.nearest_neighbours(k)
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    # Строка "матрицы" для доступа вида d[i][j]
+    def __getitem__(self, i: int) -> '_CoordinateRow':
+        return _CoordinateRow(self, i)
+
+    # Расстояние между точками i и j
+    def distance(self, i: int, j: int) -> float:
+        return hypot(self._xs[i] - self._xs[j], self._ys[i] - self._ys[j])
+
+    # Длина пути по координатам без обращения к матрице
+    def tour_length(self, path: Sequence[int]) -> float:
+        if len(path) < 2:
+            return 0.0
+        tour = self.coords[np.asarray(path, dtype=np.intp)]
+        return float(np.sqrt((np.diff(tour, axis=0) ** 2).sum(axis=1)).sum())
+
+    # Длина жадного пути "ближайший сосед" из точки start: ближайший свободный
+    # кандидат является ближайшей свободной точкой, перебор всех точек - только
+    # когда все кандидаты уже посещены
+    def nearest_neighbour_length(self, start: int = 0) -> float:
+        unvisited = np.ones(len(self), dtype=bool)
+        unvisited[start] = False
+        current = start
+        length = 0.0
+        for _ in range(len(self) - 1):
+            candidates = self.candidate_lists[current]
+            free = candidates[unvisited[candidates]]
+            nearest = int(free[0]) if free.size else self.nearest_unvisited(current, unvisited)
+            length += self.distance(current, nearest)
+            unvisited[nearest] = False
+            current = nearest
+        return length + self.distance(current, start)
+
+    # Ближайшая к i непосещенная точка (полный перебор по маске за O(n))
+    def nearest_unvisited(self, i: int, unvisited: np.ndarray) -> int:
+        remaining = np.flatnonzero(unvisited)
+        diff = self.coords[remaining] - self.coords[i]
+        return int(remaining[np.argmin((diff ** 2).sum(axis=1))])
+
+
+# Строка расстояний от одной точки
+class _CoordinateRow:
+    def __init__(self, distances: CoordinateDistances, i: int):
+        self.distances = distances
+        self.i = i
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def __getitem__(self, j: int) -> float:
+        return self.distances.distance(self.i, j)
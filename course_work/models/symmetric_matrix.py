@@ -0,0 +1,111 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+# Симметричная матрица с упакованным хранением верхнего треугольника (включая диагональ).
+# Значения лежат в одном непрерывном массиве NumPy: n(n+1)/2 чисел вместо n^2
+# объектов float в списках. При dtype=float32 на одну пару точек уходит 4 байта
+# против 2 * (24 + 8) байт у списка списков. Доступ к элементу - O(1)
+class SymmetricMatrix:
+    def __init__(self, n: int, dtype=np.float64, values: np.ndarray = None):
+        # Размер матрицы
+        self.n = n
+        # Упакованные значения верхнего треугольника по строкам
+        self.values = np.zeros(n * (n + 1) // 2, dtype=dtype) if values is None else values
+
+    # Матрица евклидовых расстояний между точками (память на построение - O(n))
+    @classmethod
+    def from_points(cls, points: Sequence[Tuple[float, float]], dtype=np.float64) -> 'SymmetricMatrix':
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        matrix = cls(len(coords), dtype)
+        for i in range(matrix.n):
+            diff = coords[i:] - coords[i]
+            matrix._row_segment(i)[:] = np.sqrt((diff ** 2).sum(axis=1))
+        return matrix
+
+    # Упаковка обычной (плотной) симметричной матрицы
+    @classmethod
+    def from_dense(cls, dense, dtype=np.float64) -> 'SymmetricMatrix':
+        dense = np.asarray(dense)
+        matrix = cls(len(dense), dtype)
+        for i in range(matrix.n):
+            matrix._row_segment(i)[:] = dense[i, i:]
+        return matrix
+
+    def __len__(self) -> int:
+        return self.n
+
+    # matrix[i, j] или matrix[rows, cols] для массивов индексов; matrix[i] - строка
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.values[self._index(*key)]
+        return _SymmetricRow(self, key)
+
+    # Запись значения сразу в обе симметричные ячейки: matrix[i, j] = value
+    def __setitem__(self, key: Tuple[int, int], value) -> None:
+        self.values[self._index(*key)] = value
+
+    # Строка матрицы целиком в виде массива
+    def row(self, i: int) -> np.ndarray:
+        return self.values[self._index(i, np.arange(self.n))]
+
+    # Распаковка в плотную матрицу n x n
+    def to_dense(self, dtype=None) -> np.ndarray:
+        dense = np.empty((self.n, self.n), dtype=dtype or self.values.dtype)
+        for i in range(self.n):
+            segment = self._row_segment(i)
+            dense[i, i:] = segment
+            dense[i:, i] = segment
+        return dense
+
+    # Распаковка в список списков
+    def tolist(self) -> List[List[float]]:
+        return self.to_dense().tolist()
+
+    # Поддержка np.asarray(matrix)
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.to_dense(dtype)
+
+    # Объем памяти, занимаемый значениями
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    # Позиция элемента (i, j) в упакованном массиве; работает и для массивов индексов
+    def _index(self, i, j):
+        low = np.minimum(i, j)
+        high = np.maximum(i, j)
+        return low * self.n - low * (low - 1) // 2 + (high - low)
+
+    # Участок упакованного массива со значениями строки i от диагонали до конца
+    def _row_segment(self, i: int) -> np.ndarray:
+        start = i * self.n - i * (i - 1) // 2
+        return self.values[start:start + self.n - i]
+
+
+# Строка упакованной матрицы для доступа вида matrix[i][j]
+class _SymmetricRow:
+    def __init__(self, matrix: SymmetricMatrix, i: int):
+        self.matrix = matrix
+        self.i = i
+
+    def __len__(self) -> int:
+        return self.matrix.n
+
+    def __getitem__(self, j):
+        i = self.i
+        # Для одиночных индексов считаем позицию без вызовов NumPy
+        if isinstance(j, (int, np.integer)):
+            if i > j:
+                i, j = j, i
+            n = self.matrix.n
+            return self.matrix.values[i * n - i * (i - 1) // 2 + (j - i)]
+        return self.matrix[i, j]
+
+    def __setitem__(self, j: int, value) -> None:
+        self.matrix[self.i, j] = value
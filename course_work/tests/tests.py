@@ -4,9 +4,23 @@ import sys
 import tempfile
 import os
 import json
+import sqlite3
+import numpy as np
 from models.graph_model import Point, GraphModel
-from models.database import DatabaseManager
+from models.database import DatabaseManager, hash_points
 from models.aco_algorithm import ACOAlgorithm
+from models import aco_numpy
+from models.local_search import two_opt
+from models.pheromone_matrix import CandidatePheromoneMatrix, ScaledPheromoneMatrix, UNDERFLOW_LIMIT
+from models.pheromone_strategies import AntColonySystem, MaxMinAntSystem, nearest_neighbour_length
+from models.symmetric_matrix import SymmetricMatrix
+from models.multi_colony import MultiColonyACO
+from models.large_instance import LargeInstanceACO
+from models.spatial_index import CoordinateDistances, GridIndex
+from utils.snapshot import Migration
+from benchmarks.tsplib import att, bundled_instances, euc_2d, parse_tour, parse_tsp
+from benchmarks.generators import clustered_points, uniform_points
+from benchmarks.run_benchmarks import run_benchmarks
 from utils.path import Path
 
 from unittest.mock import Mock, MagicMock, patch
@@ -182,6 +196,7 @@ class TestACOAlgorithm:
         assert algo.beta == 1.2
         assert algo.rho == 0.6
         assert algo.q == 10.0
+        assert algo.backend == "numpy"
 
     # тест выбора индекса на основе вероятностей
     def test_select_index(self):
@@ -200,6 +215,20 @@ class TestACOAlgorithm:
         result = ACOAlgorithm._select_index(selection)
         assert result == 2  # должен вернуть последний индекс
 
+    # тест сохранения распределения при выборе двоичным поиском
+    def test_select_index_distribution(self):
+        with patch('models.aco_algorithm.random', side_effect=[0.0, 0.1, 0.35, 0.99]):
+            picks = [ACOAlgorithm._select_index([1.0, 2.0, 0.0, 7.0]) for _ in range(4)]
+        # пороги 0, 1, 3.5, 9.9 при накопленных суммах 1, 3, 3, 10
+        assert picks == [0, 0, 3, 3]
+
+    # тест пакетного выбора для нескольких муравьев
+    def test_select_indices(self):
+        selections = [[1.0, 1.0, 2.0], [0.0, 0.0, 0.0], [0.0, 5.0, 0.0]]
+        with patch('models.aco_numpy.random', side_effect=[0.3, 0.5, 0.9]):
+            result = ACOAlgorithm._select_indices(selections)
+        assert result == [1, 2, 1]
+
     # тест вычисления длины пути
     def test_calculate_path_length(self):
         distance_matrix = [
@@ -287,6 +316,558 @@ class TestACOAlgorithm:
         algo._update_pheromone(pheromone_matrix, paths, lengths)
         # Проверяем что феромоны изменились
 
+    # тест эталонной реализации на списках
+    def test_solve_tsp_python_backend(self):
+        algo = ACOAlgorithm(ants=20, iterations=10, backend="python")
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        solution = algo.solve_tsp(points)
+
+        assert len(solution.indices) == 5
+        assert set(solution.indices[:-1]) == {0, 1, 2, 3}
+        assert 3.5 <= solution.length <= 5.0
+
+    # тест неизвестной реализации вычислений
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown backend"):
+            ACOAlgorithm(backend="fortran")
+
+    # тест совпадения обновления феромонов на списках и массивах
+    def test_update_pheromone_numpy_matches_python(self):
+        algo = ACOAlgorithm(ants=2, iterations=1)
+        paths = [[0, 1, 2, 0], [2, 1, 0, 2]]
+        lengths = [2.0, 3.0]
+        pheromone_list = [[1.0] * 3 for _ in range(3)]
+        pheromone_array = np.ones((3, 3))
+
+        algo._update_pheromone(pheromone_list, paths, lengths)
+        algo._update_pheromone(pheromone_array, paths, lengths)
+
+        assert np.allclose(pheromone_array, pheromone_list)
+
+    # тест векторизованной матрицы расстояний и длины пути
+    def test_numpy_distance_matrix(self):
+        points = [(0, 0), (3, 0), (0, 4)]
+        expected = ACOAlgorithm._build_distance_matrix(points)
+
+        matrix = aco_numpy.build_distance_matrix(points)
+
+        assert np.allclose(matrix, expected)
+        path = [0, 1, 2, 0]
+        assert ACOAlgorithm._calculate_path_length(matrix, path) == pytest.approx(12.0)
+
+    # тест матрицы выбора tau^alpha * eta^beta
+    def test_choice_info(self):
+        algo = ACOAlgorithm(alpha=2.0, beta=1.0)
+        distance_matrix = [[0.0, 2.0], [2.0, 0.0]]
+        pheromone_matrix = [[1.0, 3.0], [3.0, 1.0]]
+
+        attractiveness = algo._build_attractiveness_matrix(distance_matrix)
+        choice_info = algo._build_choice_info(pheromone_matrix, attractiveness)
+        choice_array = algo._build_choice_info(
+            np.array(pheromone_matrix),
+            algo._build_attractiveness_matrix(np.array(distance_matrix)))
+
+        assert choice_info[0][1] == pytest.approx(9.0 * 0.5)
+        assert np.allclose(choice_array, choice_info)
+
+        # путь строится только по матрице выбора
+        path = algo._create_path(choice_info)
+        assert sorted(path[:-1]) == [0, 1]
+
+    # тест списков ближайших соседей
+    def test_candidate_lists(self):
+        algo = ACOAlgorithm(candidates=2, backend="python")
+        points = [(0, 0), (1, 0), (3, 0), (6, 0)]
+        distance_matrix = algo._build_distance_matrix(points)
+
+        candidate_lists = algo._build_candidate_lists(distance_matrix)
+        candidate_array = algo._build_candidate_lists(np.array(distance_matrix))
+
+        assert candidate_lists == [[1, 2], [0, 2], [1, 0], [2, 1]]
+        assert candidate_array.tolist() == candidate_lists
+
+    # тест решения со списками кандидатов на обеих реализациях
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_solve_tsp_with_candidates(self, backend):
+        algo = ACOAlgorithm(ants=10, iterations=5, candidates=3, backend=backend)
+        points = [(x * 10, y * 10) for x in range(3) for y in range(3)]
+
+        solution = algo.solve_tsp(points)
+
+        assert len(solution.indices) == 10
+        assert set(solution.indices[:-1]) == set(range(9))
+
+    # тест параллельного построения путей в пуле процессов
+    def test_solve_tsp_parallel_workers(self):
+        algo = ACOAlgorithm(ants=9, iterations=3, workers=2)
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        solution = algo.solve_tsp(points)
+
+        assert len(solution.indices) == 5
+        assert set(solution.indices[:-1]) == {0, 1, 2, 3}
+        assert 3.5 <= solution.length <= 5.0
+
+    # тест некорректного количества процессов
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError, match="Number of workers"):
+            ACOAlgorithm(workers=0)
+
+    # тест улучшения пути локальным поиском 2-opt
+    def test_two_opt_removes_crossing(self):
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        distance_matrix = ACOAlgorithm._build_distance_matrix(points)
+        neighbour_lists = [[1, 3, 2], [0, 2, 3], [1, 3, 0], [0, 2, 1]]
+        # путь с пересечением диагоналей
+        path = [0, 2, 1, 3, 0]
+        length = ACOAlgorithm._calculate_path_length(distance_matrix, path)
+
+        improved, improved_length = two_opt(path, length, distance_matrix, neighbour_lists)
+
+        assert improved_length == pytest.approx(4.0)
+        assert ACOAlgorithm._calculate_path_length(distance_matrix, improved) == pytest.approx(4.0)
+        assert improved[0] == improved[-1]
+        assert sorted(improved[:-1]) == [0, 1, 2, 3]
+
+    # тест решения с локальным поиском для лучшего и всех путей
+    @pytest.mark.parametrize("scope", ["best", "all"])
+    def test_solve_tsp_with_local_search(self, scope):
+        algo = ACOAlgorithm(ants=5, iterations=3, local_search="2opt", local_search_scope=scope)
+        points = [(x * 10, y * 10) for x in range(4) for y in range(4)]
+
+        solution = algo.solve_tsp(points)
+
+        assert set(solution.indices[:-1]) == set(range(16))
+        distance_matrix = ACOAlgorithm._build_distance_matrix(points)
+        assert ACOAlgorithm._calculate_path_length(distance_matrix, solution.indices) == \
+            pytest.approx(solution.length)
+
+    # тест неизвестного метода локального поиска
+    def test_invalid_local_search(self):
+        with pytest.raises(ValueError, match="Unknown local search"):
+            ACOAlgorithm(local_search="3opt")
+
+    # тест остановки по исчерпанию всех итераций
+    def test_stop_reason_iterations(self):
+        algo = ACOAlgorithm(ants=5, iterations=4)
+
+        solution = algo.solve_tsp([(0, 0), (3, 0), (0, 4)])
+
+        assert solution.stop_reason == "iterations"
+        assert solution.stop_iteration == 4
+
+    # тест остановки при отсутствии улучшений
+    def test_stop_by_patience(self):
+        algo = ACOAlgorithm(ants=5, iterations=100, patience=2)
+
+        # у треугольника все пути одинаковой длины - улучшений после первой итерации нет
+        solution = algo.solve_tsp([(0, 0), (3, 0), (0, 4)])
+
+        assert solution.stop_reason == "patience"
+        assert solution.stop_iteration == 3
+
+    # тест остановки по ограничению времени
+    def test_stop_by_time_budget(self):
+        algo = ACOAlgorithm(ants=5, iterations=100, time_budget_s=1.0)
+
+        with patch('models.aco_algorithm.perf_counter', side_effect=[0.0, 0.5, 1.5]):
+            solution = algo.solve_tsp([(0, 0), (3, 0), (0, 4)])
+
+        assert solution.stop_reason == "time_budget"
+        assert solution.stop_iteration == 2
+
+    # тест решения всеми встроенными стратегиями обновления феромона
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    @pytest.mark.parametrize("strategy", ["as", "mmas", "acs", "rank"])
+    def test_solve_tsp_strategies(self, strategy, backend):
+        algo = ACOAlgorithm(ants=10, iterations=10, strategy=strategy, backend=backend)
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        solution = algo.solve_tsp(points)
+
+        assert set(solution.indices[:-1]) == {0, 1, 2, 3}
+        assert 3.5 <= solution.length <= 5.0
+
+    # тест границ феромона в MAX-MIN Ant System
+    def test_mmas_bounds(self):
+        algo = ACOAlgorithm(rho=0.5, q=1.0, strategy=MaxMinAntSystem(min_ratio=0.1))
+        pheromone_matrix = [[10.0] * 3 for _ in range(3)]
+        paths = [[0, 1, 2, 0], [0, 2, 1, 0]]
+
+        algo.strategy.update(algo, pheromone_matrix, paths, [4.0, 5.0], paths[0], 2.0)
+
+        # tau_max = q / (rho * best_length) = 1.0, tau_min = 0.1
+        assert max(max(row) for row in pheromone_matrix) == pytest.approx(1.0)
+        assert min(min(row) for row in pheromone_matrix) >= 0.1
+
+    # тест локального обновления Ant Colony System
+    def test_acs_local_update(self):
+        strategy = AntColonySystem(q0=0.9, xi=0.5)
+        algo = ACOAlgorithm(alpha=1.0, strategy=strategy)
+        strategy.tau0 = 0.2
+        pheromone_matrix = ScaledPheromoneMatrix([[1.0] * 3 for _ in range(3)])
+        attractiveness = [[2.0] * 3 for _ in range(3)]
+        choice_info = [[2.0] * 3 for _ in range(3)]
+
+        strategy.local_update(algo, pheromone_matrix, choice_info, attractiveness, [0, 1])
+
+        assert pheromone_matrix[0][1] == pheromone_matrix[1][0] == pytest.approx(0.6)
+        assert choice_info[0][1] == pytest.approx(1.2)
+        assert pheromone_matrix[1][2] == 1.0
+        assert choice_info[1][2] == 2.0
+
+    # тест совпадения отложенного испарения с полным проходом по матрице
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_scaled_pheromone_matches_eager(self, backend):
+        algo = ACOAlgorithm(rho=0.6, q=10, backend=backend)
+        eager = [[1.0] * 4 for _ in range(4)]
+        lazy = algo._init_pheromone_matrix(4, 1.0)
+        paths = [[0, 1, 2, 3, 0], [0, 2, 1, 3, 0]]
+        lengths = [4.0, 5.0]
+
+        for _ in range(200):
+            algo._update_pheromone(eager, paths, lengths)
+            algo._update_pheromone(lazy, paths, lengths)
+
+        # множитель нормализовался, не достигнув потери точности
+        assert lazy.scale >= UNDERFLOW_LIMIT
+        assert np.allclose(lazy.to_matrix(), eager)
+        assert lazy[0][1] == pytest.approx(eager[0][1])
+
+    # тест пересчета матрицы выбора только на измененных ребрах
+    def test_refresh_choice_info(self):
+        algo = ACOAlgorithm(alpha=1.0, rho=0.5, q=1.0)
+        pheromone_matrix = algo._init_pheromone_matrix(3, 1.0)
+        attractiveness = np.full((3, 3), 2.0)
+        choice_info = algo._build_choice_info(pheromone_matrix, attractiveness)
+
+        algo._update_pheromone(pheromone_matrix, [[0, 1, 0]], [2.0])
+        algo._refresh_choice_info(choice_info, pheromone_matrix, attractiveness)
+
+        expected = algo._build_choice_info(pheromone_matrix.to_matrix(), attractiveness)
+        # веса отличаются только общим множителем, вероятности выбора совпадают
+        ratio = expected / choice_info
+        assert np.allclose(ratio, ratio[0, 0])
+
+    # тест неизвестной стратегии
+    def test_invalid_strategy(self):
+        with pytest.raises(ValueError, match="Unknown pheromone strategy"):
+            ACOAlgorithm(strategy="elitist")
+
+    # тест пошагового решения со снимками после каждой итерации
+    def test_solve_tsp_iter(self):
+        algo = ACOAlgorithm(ants=5, iterations=4)
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        snapshots = list(algo.solve_tsp_iter(points))
+
+        assert [snapshot.iteration for snapshot in snapshots] == [1, 2, 3, 4]
+        lengths = [snapshot.best_length for snapshot in snapshots]
+        assert lengths == sorted(lengths, reverse=True)
+        assert [snapshot.stop_reason for snapshot in snapshots] == [None, None, None, "iterations"]
+        assert len(snapshots[-1].best_path) == 5
+        assert snapshots[-1].elapsed >= snapshots[0].elapsed
+
+    # тест прерывания пошагового решения вызывающим кодом
+    def test_solve_tsp_iter_early_exit(self):
+        algo = ACOAlgorithm(ants=5, iterations=100)
+        iterator = algo.solve_tsp_iter([(0, 0), (3, 0), (0, 4)])
+
+        first = next(iterator)
+        iterator.close()
+
+        assert first.iteration == 1
+        assert first.best_length == pytest.approx(12.0)
+
+    # тест проверки входных данных до первого шага генератора
+    def test_solve_tsp_iter_insufficient_points(self):
+        with pytest.raises(ValueError, match="Need at least 3 points for TSP"):
+            ACOAlgorithm().solve_tsp_iter([(0, 0)])
+
+    # тест решения по готовой матрице расстояний с пользовательскими весами
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_solve_tsp_with_distance_matrix(self, backend):
+        algo = ACOAlgorithm(ants=10, iterations=5, backend=backend)
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        graph = GraphModel()
+        graph.min_distance = 0.0
+        for x, y in points:
+            graph.add_point(x, y)
+        # ребро 0-2 (диагональ) очень короткое
+        graph.add_edge(0, 2, 0.1)
+
+        solution = algo.solve_tsp(points, distance_matrix=graph.distance_matrix)
+
+        length = ACOAlgorithm._calculate_path_length(graph.distance_matrix, solution.indices)
+        assert solution.length == pytest.approx(length)
+
+    # тест использования массива без копирования
+    def test_prepare_distance_matrix_no_copy(self):
+        algo = ACOAlgorithm()
+        matrix = aco_numpy.build_distance_matrix([(0, 0), (3, 0), (0, 4)])
+
+        assert algo._prepare_distance_matrix([], matrix) is matrix
+
+    # тест несовпадения размера матрицы и числа точек
+    def test_distance_matrix_size_mismatch(self):
+        with pytest.raises(ValueError, match="Distance matrix size"):
+            ACOAlgorithm().solve_tsp([(0, 0), (3, 0), (0, 4)], distance_matrix=[[0.0]])
+
+    # тест решения с хранением матриц в float32
+    def test_solve_tsp_float32(self):
+        algo = ACOAlgorithm(ants=10, iterations=10, precision="float32", local_search="2opt")
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        solution = algo.solve_tsp(points)
+
+        assert isinstance(solution.length, float)
+        assert 3.5 <= solution.length <= 5.0
+
+    # тест решения по упакованной матрице модели графа
+    def test_solve_tsp_with_symmetric_matrix(self):
+        algo = ACOAlgorithm(ants=10, iterations=5)
+        points = [(0, 0), (100, 0), (100, 100), (0, 100)]
+        matrix = SymmetricMatrix.from_points(points)
+
+        assert algo._prepare_distance_matrix(points, matrix) is matrix
+        solution = algo.solve_tsp(points, distance_matrix=matrix)
+        assert solution.length == pytest.approx(400.0)
+
+    # тест теплого старта: известный путь становится начальным лучшим решением
+    @pytest.mark.parametrize("backend", ["numpy", "python"])
+    def test_warm_start(self, backend):
+        algo = ACOAlgorithm(ants=1, iterations=1, backend=backend, strategy="mmas")
+        points = [(0, 0), (1, 0), (1, 1), (0, 1), (0.5, 0.2)]
+        tour = [0, 4, 1, 2, 3, 0]
+
+        solution = algo.solve_tsp(points, warm_start=[tour])
+
+        expected = ACOAlgorithm._calculate_path_length(
+            ACOAlgorithm._build_distance_matrix(points), tour)
+        assert solution.length <= expected + 1e-9
+
+    # тест усиления феромона на ребрах известного пути
+    def test_warm_start_pheromone(self):
+        algo = ACOAlgorithm(ants=1, iterations=1, warm_start_weight=2.0)
+        iterator = algo.solve_tsp_iter([(0, 0), (3, 0), (0, 4), (3, 4)],
+                                       warm_start=[[0, 1, 3, 2, 0]])
+
+        pheromone = next(iterator).pheromone_matrix.to_matrix()
+
+        # ребро пути 0-1 сильнее диагонали 0-3, которой в пути нет
+        assert pheromone[0][1] > pheromone[0][3]
+
+    # тест некорректного пути теплого старта
+    def test_invalid_warm_start(self):
+        algo = ACOAlgorithm()
+        with pytest.raises(ValueError, match="Warm start tour"):
+            algo.solve_tsp_iter([(0, 0), (1, 0), (1, 1)], warm_start=[[0, 1, 1, 0]])
+        with pytest.raises(ValueError, match="Warm start weight"):
+            ACOAlgorithm(warm_start_weight=-1)
+
+    # тест некорректного размера списка кандидатов
+    def test_invalid_candidates(self):
+        with pytest.raises(ValueError, match="Candidate list size"):
+            ACOAlgorithm(candidates=0)
+
+# Тесты для класса MultiColonyACO
+class TestMultiColonyACO:
+
+    # тест островной модели с обменом лучшими путями и смешиванием феромона
+    @pytest.mark.parametrize("migration", ["tours", "pheromone"])
+    def test_solve_tsp(self, migration):
+        solver = MultiColonyACO(colonies=2, migration_interval=2, migration=migration,
+                                ants=5, iterations=5)
+        points = [(0, 0), (1, 0), (1, 1), (0, 1)]
+
+        solution = solver.solve_tsp(points)
+
+        assert isinstance(solution, Path)
+        assert set(solution.indices[:-1]) == {0, 1, 2, 3}
+        assert 3.5 <= solution.length <= 5.0
+        assert solution.stop_iteration == 5
+
+    # тест колоний, останавливающихся в разное время
+    def test_colonies_stop_independently(self):
+        solver = MultiColonyACO(colonies=3, migration_interval=1,
+                                ants=3, iterations=50, patience=2)
+
+        solution = solver.solve_tsp([(0, 0), (3, 0), (0, 4)])
+
+        assert solution.length == pytest.approx(12.0)
+
+    # тест передачи чужого пути в генератор колонии
+    def test_migration_updates_best(self):
+        algo = ACOAlgorithm(ants=2, iterations=3)
+        iterator = algo.solve_tsp_iter([(0, 0), (3, 0), (0, 4)])
+        next(iterator)
+
+        snapshot = iterator.send(Migration(tours=[([0, 1, 2, 0], 1.0)]))
+
+        assert snapshot.best_length == 1.0
+        assert snapshot.best_path == [0, 1, 2, 0]
+
+    # тест некорректных параметров
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="Number of colonies"):
+            MultiColonyACO(colonies=0)
+        with pytest.raises(ValueError, match="Unknown migration"):
+            MultiColonyACO(migration="genes")
+        with pytest.raises(ValueError, match="Unknown backend"):
+            MultiColonyACO(backend="fortran")
+
+# Тесты для режима больших задач
+class TestLargeInstance:
+
+    # тест точности списков соседей по сетке
+    def test_grid_nearest_neighbours(self):
+        rng = np.random.default_rng(0)
+        points = np.vstack([rng.random((150, 2)), rng.normal(5, 0.01, (50, 2))])
+
+        neighbours, distances = GridIndex(points).nearest_neighbours(5)
+
+        dense = aco_numpy.build_distance_matrix(points)
+        np.fill_diagonal(dense, np.inf)
+        assert np.allclose(distances, np.sort(dense, axis=1)[:, :5])
+        assert np.allclose(dense[np.arange(200)[:, None], neighbours], distances)
+
+    # тест расстояний и длины пути по координатам
+    def test_coordinate_distances(self):
+        points = [(0, 0), (3, 0), (3, 4), (0, 4)]
+        distances = CoordinateDistances(points, 2)
+
+        assert distances[0][2] == pytest.approx(5.0)
+        assert distances.tour_length([0, 1, 2, 3, 0]) == pytest.approx(14.0)
+        assert distances.nearest_neighbour_length() == \
+            pytest.approx(nearest_neighbour_length(aco_numpy.build_distance_matrix(points)))
+
+    # тест феромона только на ребрах из списков кандидатов
+    def test_candidate_pheromone_deposit(self):
+        candidate_lists = np.array([[1, 2], [0, 2], [1, 0], [2, 1]])
+        matrix = CandidatePheromoneMatrix(candidate_lists, 1.0)
+
+        matrix.deposit([[0, 1, 3, 0]], [2.0])
+
+        # ребро 0-1 есть в обоих списках, 1-3 - только в списке 3, 3-0 - ни в одном
+        assert matrix[0][1] == matrix[1][0] == 3.0
+        assert matrix[3][1] == 3.0 and matrix[1][3] == 0.0
+        assert matrix[0][2] == 1.0
+
+    # тест решения без матрицы расстояний
+    @pytest.mark.parametrize("strategy", ["as", "mmas", "acs", "rank"])
+    def test_solve_tsp(self, strategy):
+        algo = LargeInstanceACO(candidates=3, ants=5, iterations=5, strategy=strategy)
+        points = [(0, 0), (1, 0), (2, 0), (2, 1), (1, 1), (0, 1)]
+
+        solution = algo.solve_tsp(points)
+
+        assert sorted(solution.indices[:-1]) == list(range(6))
+        assert solution.length == pytest.approx(6.0)
+
+    # тест некорректных параметров
+    def test_invalid_parameters(self):
+        with pytest.raises(ValueError, match="numpy backend"):
+            LargeInstanceACO(backend="python")
+        with pytest.raises(ValueError, match="from coordinates"):
+            LargeInstanceACO().solve_tsp([(0, 0), (1, 0), (0, 1)], [[0.0] * 3] * 3)
+
+# Тесты для чтения TSPLIB и замеров производительности
+class TestBenchmarks:
+
+    # тест разбора задачи и оптимального пути
+    def test_parse_tsp_and_tour(self):
+        instance = parse_tsp("""NAME : square
+TYPE : TSP
+DIMENSION : 4
+EDGE_WEIGHT_TYPE : EUC_2D
+NODE_COORD_SECTION
+1 0 0
+2 3 0
+3 3 4
+4 0 4
+EOF""")
+        tour = parse_tour("TYPE : TOUR\nTOUR_SECTION\n1\n2\n3\n4\n-1\nEOF")
+
+        assert instance.name == "square"
+        assert instance.points == [(0.0, 0.0), (3.0, 0.0), (3.0, 4.0), (0.0, 4.0)]
+        assert tour == [0, 1, 2, 3, 0]
+        assert instance.distance_matrix()[0][2] == 5.0
+
+    # тест функций расстояния TSPLIB
+    def test_distance_functions(self):
+        assert euc_2d((0, 0), (1, 1)) == 1
+        # sqrt(100 / 10) = 3.16... округляется вверх
+        assert att((0, 0), (10, 0)) == 4
+        assert att((0, 0), (0, 0)) == 0
+        with pytest.raises(ValueError, match="Unsupported edge weight type"):
+            parse_tsp("DIMENSION: 1\nEDGE_WEIGHT_TYPE: EXPLICIT\nNODE_COORD_SECTION\n1 0 0")
+
+    # тест известных оптимумов поставляемых задач (GEO и EUC_2D)
+    def test_bundled_optima(self):
+        optima = {instance.name: instance.optimal_length() for instance in bundled_instances()}
+
+        assert optima == {"burma14": 3323.0, "ulysses16": 6859.0, "berlin52": 7542.0}
+
+    # тест воспроизводимости синтетических задач
+    def test_generators(self):
+        assert uniform_points(10, seed=1) == uniform_points(10, seed=1)
+        points = clustered_points(50, clusters=3, seed=2)
+        assert len(points) == 50
+        assert all(0 <= x <= 1000 and 0 <= y <= 1000 for x, y in points)
+
+    # тест отчета замеров
+    def test_benchmark_report(self):
+        suite = [("triangle", [(0, 0), (3, 0), (0, 4)], None, 12.0)]
+
+        report = run_benchmarks(suite, [0.01], {"ants": 2}, repeats=2)
+
+        result = report["instances"][0]["results"][0]
+        assert result["best_length"] == pytest.approx(12.0)
+        assert result["gap_percent"] == pytest.approx(0.0)
+        assert result["constructions_per_s"] > 0
+        json.dumps(report)
+
+# Тесты для класса SymmetricMatrix
+class TestSymmetricMatrix:
+
+    # тест построения по точкам и доступа к элементам
+    def test_from_points(self):
+        matrix = SymmetricMatrix.from_points([(0, 0), (3, 0), (0, 4)])
+
+        assert len(matrix) == 3
+        assert len(matrix[0]) == 3
+        assert matrix[0][1] == matrix[1][0] == 3.0
+        assert matrix[1, 2] == matrix[2, 1] == 5.0
+        assert matrix[2][2] == 0.0
+
+    # тест симметричной записи значения
+    def test_set_item(self):
+        matrix = SymmetricMatrix(3)
+
+        matrix[2, 0] = 7.5
+
+        assert matrix[0][2] == 7.5
+        assert matrix[2][0] == 7.5
+
+    # тест выборки массивами индексов и строк
+    def test_vectorized_access(self):
+        dense = np.array([[0, 1, 2], [1, 0, 3], [2, 3, 0]], dtype=float)
+        matrix = SymmetricMatrix.from_dense(dense)
+
+        assert matrix[np.array([0, 1, 2]), np.array([1, 2, 0])].tolist() == [1, 3, 2]
+        assert matrix.row(1).tolist() == [1, 0, 3]
+        assert np.array_equal(matrix.to_dense(), dense)
+        assert matrix.tolist() == dense.tolist()
+
+    # тест упакованного хранения
+    def test_packed_storage(self):
+        matrix = SymmetricMatrix.from_points([(i, 0) for i in range(100)], np.float32)
+
+        # верхний треугольник с диагональю, по 4 байта на значение
+        assert matrix.nbytes == 100 * 101 // 2 * 4
+        assert matrix.dtype == np.float32
+
 # Тесты для класса DatabaseManager
 class TestDatabaseManager:
 
@@ -392,6 +973,44 @@ class TestDatabaseManager:
         lengths_5 = [r[4] for r in results_5]
         assert lengths_5 == sorted(lengths_5)
 
+    # тест поиска лучших путей по хешу набора точек
+    def test_get_best_tours(self):
+        points_hash = hash_points([(0, 0), (1, 0), (1, 1)])
+        for length, indices in [(5.0, [0, 2, 1, 0]), (3.0, [0, 1, 2, 0]), (4.0, [0, 1, 2, 0])]:
+            self.db.save_result(points_count=3, algorithm_params={}, path_length=length,
+                                path_indices=indices, computation_time=0.1,
+                                points_hash=points_hash)
+        self.db.save_result(points_count=3, algorithm_params={}, path_length=1.0,
+                            path_indices=[0, 1, 2, 0], computation_time=0.1)
+
+        tours = self.db.get_best_tours(points_hash)
+
+        assert tours == [([0, 1, 2, 0], 3.0), ([0, 2, 1, 0], 5.0)]
+        assert self.db.get_best_tours(hash_points([(0, 0), (1, 0), (2, 2)])) == []
+
+    # тест хеша набора точек
+    def test_hash_points(self):
+        assert hash_points([(0, 0), (1, 2)]) == hash_points([(0.0, 0.0), (1.0, 2.0)])
+        assert hash_points([(0, 0), (1, 2)]) != hash_points([(1, 2), (0, 0)])
+
+    # тест добавления столбца хеша в базу старого формата
+    def test_migrates_old_schema(self):
+        old_path = os.path.join(self.temp_dir, "old.db")
+        with sqlite3.connect(old_path) as conn:
+            conn.execute('''
+                CREATE TABLE tsp_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+                    points_count INTEGER NOT NULL, algorithm_params TEXT NOT NULL,
+                    path_length REAL NOT NULL, path_indices TEXT NOT NULL,
+                    computation_time REAL NOT NULL)
+            ''')
+
+        db = DatabaseManager(old_path)
+        db.save_result(points_count=3, algorithm_params={}, path_length=1.0,
+                       path_indices=[0, 1, 2, 0], computation_time=0.1, points_hash="abc")
+
+        assert db.get_best_tours("abc") == [([0, 1, 2, 0], 1.0)]
+
     # тест работы с пустой базой данных
     def test_empty_results(self):
         results = self.db.get_all_results()
@@ -440,6 +1059,7 @@ class TestMainController:
         # Создаем моки для зависимостей
         self.mock_model = Mock(spec=GraphModel)
         self.mock_database = Mock(spec=DatabaseManager)
+        self.mock_database.get_best_tours.return_value = []
         self.mock_view = Mock(spec=MainWindow)
 
         self.mock_model.points = []
@@ -651,6 +1271,7 @@ class TestMainController:
         # Настраиваем моки
         self.mock_model.points = [Mock(), Mock(), Mock(), Mock()]  # 4 точки
         self.mock_model.get_points.return_value = [(0, 0), (1, 1), (2, 2), (3, 3)]
+        self.mock_model.distance_matrix = [[0.0] * 4 for _ in range(4)]
 
         mock_time.side_effect = [1000, 1002]  # start_time, end_time
 
@@ -677,7 +1298,9 @@ class TestMainController:
         mock_aco_class.assert_called_once_with(
             ants=100, iterations=20, alpha=1.5, beta=1.2, rho=0.6, q=10.0
         )
-        mock_algorithm.solve_tsp.assert_called_once_with([(0, 0), (1, 1), (2, 2), (3, 3)])
+        mock_algorithm.solve_tsp.assert_called_once_with(
+            [(0, 0), (1, 1), (2, 2), (3, 3)], distance_matrix=self.mock_model.distance_matrix,
+            warm_start=None)
 
         self.mock_database.save_result.assert_called_once()
         self.mock_view.draw_solution.assert_called_once_with([0, 1, 2, 3, 0])
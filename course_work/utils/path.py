@@ -1,15 +1,20 @@
-from typing import List
+from typing import List, Optional
 
 
 # Класс для представления пути в задаче коммивояжера
 class Path:
-    def __init__(self, indices: List[int], length: float, name: str = ""):
+    def __init__(self, indices: List[int], length: float, name: str = "",
+                 stop_reason: Optional[str] = None, stop_iteration: Optional[int] = None):
         # Список индексов точек в порядке обхода маршрута
         self.indices = indices
         # Общая длина пути (сумма расстояний между последовательными точками)
         self.length = length
         # Название пути (например, "ACO Solution" или название алгоритма)
         self.name = name
+        # Причина остановки алгоритма: "iterations", "time_budget" или "patience"
+        self.stop_reason = stop_reason
+        # Номер итерации, после которой алгоритм остановился
+        self.stop_iteration = stop_iteration
 
     def __str__(self):
         # Строковое представление пути в формате: "Название: длина.ед"
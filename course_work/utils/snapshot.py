@@ -0,0 +1,36 @@
+from typing import List, Optional, Tuple
+
+
+# Снимок состояния муравьиного алгоритма после очередной итерации
+class IterationSnapshot:
+    def __init__(self, iteration: int, best_length: float, best_path: List[int],
+                 elapsed: float, stop_reason: Optional[str] = None,
+                 pheromone_matrix=None):
+        # Номер завершенной итерации (начиная с 1)
+        self.iteration = iteration
+        # Длина лучшего найденного пути
+        self.best_length = best_length
+        # Лучший найденный путь (общий с алгоритмом список, изменять нельзя)
+        self.best_path = best_path
+        # Время с начала решения в секундах
+        self.elapsed = elapsed
+        # Причина остановки - заполняется только в последнем снимке
+        self.stop_reason = stop_reason
+        # Текущая матрица феромонов колонии (ссылка без копирования, изменять нельзя)
+        self.pheromone_matrix = pheromone_matrix
+
+    def __str__(self):
+        return f"Iteration {self.iteration}: {self.best_length:.2f} units ({self.elapsed:.2f} s)"
+
+
+
+# Данные миграции, передаваемые в генератор решения через send()
+class Migration:
+    def __init__(self, tours: Optional[List[Tuple[List[int], float]]] = None,
+                 pheromone_matrix=None, blend_weight: float = 0.0):
+        # Лучшие пути других колоний: пары (путь, длина)
+        self.tours = tours or []
+        # Истинные значения феромона другой колонии для смешивания
+        self.pheromone_matrix = pheromone_matrix
+        # Доля чужого феромона при смешивании
+        self.blend_weight = blend_weight
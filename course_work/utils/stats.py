@@ -0,0 +1,46 @@
+from typing import Any, Dict
+
+
+# Счетчики и время этапов решения муравьиным алгоритмом.
+# Этапы не пересекаются: построение путей учитывает только выбор следующей точки
+# и обновление посещенных, без вычисления длин и локального поиска. Время
+# измеряется один раз на этап итерации (и на путь для длины и локального поиска),
+# поэтому сбор статистики практически не замедляет решение.
+# При построении путей в пуле процессов время вычисления длин и локального поиска
+# суммируется по процессам, а время построения - это общее время этапа
+class SolverStats:
+    def __init__(self):
+        # Число выполненных итераций
+        self.iterations = 0
+        # Число построенных путей
+        self.tours_built = 0
+        # Число выборов следующей точки (n - 1 на каждый путь)
+        self.selections = 0
+        # Число запусков локального поиска
+        self.local_search_calls = 0
+        # Сколько раз улучшался лучший найденный путь
+        self.improvements = 0
+        # Итерация, на которой найден лучший путь (0 - путь теплого старта)
+        self.iteration_of_best = 0
+        # Подготовка матриц и списков перед первой итерацией, с
+        self.setup_time = 0.0
+        # Построение путей (выбор следующей точки), с
+        self.construction_time = 0.0
+        # Вычисление длин путей, с
+        self.length_time = 0.0
+        # Локальный поиск, с
+        self.local_search_time = 0.0
+        # Обновление феромона и матрицы выбора, с
+        self.pheromone_time = 0.0
+        # Общее время решения, с
+        self.total_time = 0.0
+
+    # Словарь значений (для JSON и ответа веб-приложения)
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+    def __str__(self):
+        return (f"{self.iterations} iterations, {self.tours_built} tours in {self.total_time:.3f} s "
+                f"(construction {self.construction_time:.3f} s, length {self.length_time:.3f} s, "
+                f"local search {self.local_search_time:.3f} s, "
+                f"pheromone {self.pheromone_time:.3f} s)")